@@ -8,6 +8,7 @@
 # For v2 athletes, iterates through all projects.
 
 import argparse
+import os
 import pathlib
 import subprocess
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -76,10 +77,13 @@ def should_skip(project_dir: pathlib.Path, display_name: str, force: bool) -> bo
     return False
 
 
-def render_one(project_dir: pathlib.Path, display_name: str, keep_work: bool, python: str) -> tuple[str, int]:
+def render_one(project_dir: pathlib.Path, display_name: str, keep_work: bool, python: str,
+               clip_jobs: int = 0) -> tuple[str, int]:
     cmd = [python, "render_highlight.py", "--dir", str(project_dir)]
     if keep_work:
         cmd.append("--keep-work")
+    if clip_jobs > 0:
+        cmd += ["--jobs", str(clip_jobs)]
     print("•", " ".join(cmd))
     proc = subprocess.run(cmd)
     return (display_name, proc.returncode)
@@ -130,10 +134,13 @@ def main():
                 failures += 1
         print(f"\n✅ Done. {len(queue)-failures} succeeded, {failures} failed.")
     else:
-        # Parallel (be mindful of CPU/GPU/IO load)
+        # Parallel (be mindful of CPU/GPU/IO load). Each render_highlight.py
+        # renders its clips in parallel too, so split the cores between them.
+        clip_jobs = max(1, (os.cpu_count() or 2) // args.jobs)
         failures = 0
         with ThreadPoolExecutor(max_workers=args.jobs) as ex:
-            futs = [ex.submit(render_one, project_dir, display_name, args.keep_work, args.python)
+            futs = [ex.submit(render_one, project_dir, display_name, args.keep_work, args.python,
+                              clip_jobs)
                     for project_dir, display_name in queue]
             for fut in as_completed(futs):
                 name, rc = fut.result()
@@ -57,26 +57,51 @@
 #   python mark_play.py --dir athletes/jane_smith/projects/Fall\ 2025
 #
 # Requires: OpenCV (cv2), FFmpeg
+# Optional: PyAV (av) for faster, frame-accurate seeking on the proxy
 
 import argparse
 import cv2
 import json
+import mmap
+import numpy as np
+import os
 import pathlib
+import queue
+import struct
 import subprocess
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 # Import FFmpeg utilities for bundled binary detection
 try:
-    from ffmpeg_utils import get_ffmpeg_path
+    from ffmpeg_utils import get_ffmpeg_path, get_ffprobe_path
     FFMPEG_CMD = get_ffmpeg_path() or "ffmpeg"
+    FFPROBE_CMD = get_ffprobe_path() or "ffprobe"
 except ImportError:
     # Fallback to system binary if ffmpeg_utils not available
     FFMPEG_CMD = "ffmpeg"
+    FFPROBE_CMD = "ffprobe"
+
+# PyAV seeks by timestamp and is considerably faster than OpenCV's
+# CAP_PROP_POS_FRAMES; fall back to cv2.VideoCapture when it isn't installed.
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
 
 # Import clip sync utilities for marking status detection
 from clip_sync import is_clip_marked, get_clip_filename
 
+# JSON read/atomic write helpers (use orjson when installed)
+from utils import jsonio
+from utils.jsonio import atomic_write_json
+
 # Import structure detection utilities
 from utils.structure import (
     detect_structure,
@@ -90,28 +115,74 @@ from utils.structure import (
     get_intro_dir,
 )
 
+# Fail fast on damaged proxies: OpenCV retries a failed read 4096 times by default
+os.environ.setdefault("OPENCV_FFMPEG_READ_ATTEMPTS", "256")
+# Leave cores for the parallel proxy builds running alongside the marker UI
+cv2.setNumThreads(max(2, (os.cpu_count() or 4) // 2))
+
 ROOT = pathlib.Path.cwd()
 ATHLETES = ROOT / "athletes"
 
 TARGET_W = 1920
 FPS = 30
 CRF = 18
+PRESET = "faster"
+# Keyframe interval for H.264 proxies (0.5s at 30fps); encoders default to
+# ~250, which makes every seek decode up to 8 seconds of video
+PROXY_GOP = 15
 RADIUS_MIN = 6
 RADIUS_MAX = 600
 ZOOM_MIN = 1.0
 ZOOM_MAX = 2.0
 ZOOM_STEP = 0.1
+# Number keys 1-5 -> ring radius (std px)
+RADIUS_PRESETS = {ord('1'): 40, ord('2'): 60, ord('3'): 72, ord('4'): 90, ord('5'): 120}
+# Forward jumps up to this many frames are decoded through with grab() instead
+# of a CAP_PROP_POS_FRAMES seek (which snaps back to the previous keyframe).
+GRAB_SKIP_MAX = 8
+# Decoded frames kept (display-sized, ~2.7 MB each at 1280x720) so stepping
+# back and forth around the spot frame doesn't re-seek and re-decode.
+FRAME_CACHE_SIZE = 64
 VIDEO_EXTS = {".mp4", ".mov", ".m4v", ".mkv", ".avi"}
+# Arrow key codes as returned by cv2.waitKeyEx (full codes; waitKey() & 0xFF
+# folds them onto ASCII letters on Linux and loses them on Windows)
+if sys.platform.startswith("win"):
+    KEY_LEFT, KEY_UP, KEY_RIGHT, KEY_DOWN = 2424832, 2490368, 2555904, 2621440
+elif sys.platform == "darwin":
+    KEY_LEFT, KEY_UP, KEY_RIGHT, KEY_DOWN = 63234, 63232, 63235, 63233
+else:
+    KEY_LEFT, KEY_UP, KEY_RIGHT, KEY_DOWN = 65361, 65362, 65363, 65364
+ARROW_KEYS = {KEY_LEFT, KEY_UP, KEY_RIGHT, KEY_DOWN}
+# Proxy codec: "h264" (default), "h264-allintra" or "mjpeg". The all-intra
+# variants make every frame a keyframe, so seeking or stepping backwards never
+# decodes forward from a keyframe, at 3-5x the file size. Select with
+# --proxy-codec (or the PROXY_CODEC environment variable).
+PROXY_CODECS = ["h264", "h264-allintra", "mjpeg"]
+PROXY_CODEC = os.environ.get("PROXY_CODEC", "h264").lower()
+# Proxy filename suffix per codec, so switching codecs never reuses the other kind
+PROXY_SUFFIXES = {"h264": "_std.mp4", "h264-allintra": "_std_intra.mp4", "mjpeg": "_std.mov"}
+# Hardware H.264 encoders tried by --hwenc, in order of preference
+HW_ENCODERS = ["h264_nvenc", "h264_qsv", "h264_videotoolbox", "h264_vaapi"]
+VAAPI_DEVICE = "/dev/dri/renderD128"
 
 def run(cmd: list[str]):
+    """Run an ffmpeg command quietly; its error output is only shown on failure.
+
+    Proxy builds run in parallel with the marking UI, so ffmpeg's banner and
+    progress lines would otherwise interleave on the terminal.
+    """
+    cmd = [cmd[0], "-hide_banner", "-loglevel", "error", "-nostats", *cmd[1:]]
     print("•", " ".join(cmd))
-    if subprocess.call(cmd) != 0:
-        raise RuntimeError("Command failed")
+    p = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if p.returncode != 0:
+        raise RuntimeError(f"Command failed: {p.stderr.strip() or f'exit code {p.returncode}'}")
 
 def find_athletes() -> list[pathlib.Path]:
     if not ATHLETES.exists():
         return []
-    return sorted([p for p in ATHLETES.iterdir() if p.is_dir()])
+    # scandir's DirEntry caches the file type, so no extra stat() per entry
+    with os.scandir(ATHLETES) as it:
+        return sorted(pathlib.Path(e.path) for e in it if e.is_dir())
 
 def choose_athlete_interactive() -> pathlib.Path | None:
     options = find_athletes()
@@ -192,17 +263,241 @@ def validate_athlete_dir(base: pathlib.Path) -> dict[str, pathlib.Path]:
     return validate_project_dir(base)
 
 def list_clips(clips_in: pathlib.Path) -> List[pathlib.Path]:
-    return sorted([p for p in clips_in.iterdir() if p.suffix.lower() in VIDEO_EXTS])
-
-def build_proxy(src: pathlib.Path, dst: pathlib.Path):
-    """Standardize to 1920x?, 30fps, setsar=1, -noautorotate, H.264, video-only."""
+    with os.scandir(clips_in) as it:
+        return sorted(pathlib.Path(e.path) for e in it
+                      if e.is_file() and os.path.splitext(e.name)[1].lower() in VIDEO_EXTS)
+
+def proxy_path_for(prox_dir: pathlib.Path, src: pathlib.Path, codec: str = PROXY_CODEC) -> pathlib.Path:
+    suffix = PROXY_SUFFIXES.get(codec, "_std.mp4")
+    return prox_dir / f"proxy_{src.stem}{suffix}"
+
+def detect_hw_encoder() -> str | None:
+    """Return the first hardware H.264 encoder this ffmpeg build lists, if any."""
+    try:
+        out = subprocess.run([FFMPEG_CMD,"-hide_banner","-encoders"],
+                             capture_output=True, text=True).stdout
+    except OSError:
+        return None
+    for enc in HW_ENCODERS:
+        if f" {enc} " in out:
+            return enc
+    return None
+
+def hw_encoder_args(encoder: str, vf: str) -> tuple[list[str], str, list[str]]:
+    """(input args, filter chain, codec args) for a hardware encoder."""
+    if encoder == "h264_nvenc":
+        return [], vf, ["-c:v","h264_nvenc","-preset","p4","-cq","20","-pix_fmt","yuv420p"]
+    if encoder == "h264_qsv":
+        return [], vf, ["-c:v","h264_qsv","-global_quality","20","-pix_fmt","nv12"]
+    if encoder == "h264_videotoolbox":
+        return [], vf, ["-c:v","h264_videotoolbox","-q:v","50","-pix_fmt","yuv420p"]
+    if encoder == "h264_vaapi":
+        return (["-vaapi_device",VAAPI_DEVICE], vf + ",format=nv12,hwupload",
+                ["-c:v","h264_vaapi","-qp","22"])
+    raise ValueError(f"Unknown hardware encoder: {encoder}")
+
+def needs_rebuild(src: pathlib.Path, dst: pathlib.Path) -> bool:
+    """True when the proxy is missing or older than its source clip."""
+    try:
+        return dst.stat().st_mtime < src.stat().st_mtime
+    except FileNotFoundError:
+        return True
+
+def _is_target_fps(rate: str) -> bool:
+    """True for an ffprobe rate string ("30/1", "60000/2000") equal to FPS."""
+    num, _, den = rate.partition("/")
+    try:
+        return int(den or 1) > 0 and int(num) == FPS * int(den or 1)
+    except ValueError:
+        return False
+
+def has_short_gop(src: pathlib.Path, seconds: int = 10) -> bool:
+    """True if no keyframe interval in the first `seconds` of the source's
+    video exceeds PROXY_GOP frames (copied proxies keep the source's GOP)."""
+    try:
+        out = subprocess.check_output(
+            [FFPROBE_CMD,"-v","error","-select_streams","v:0",
+             "-read_intervals",f"%+{seconds}","-show_entries","packet=flags",
+             "-of","csv=p=0",str(src)],
+            text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    run_len = longest = 0
+    seen_key = False
+    for flags in out.split():
+        if "K" in flags:
+            seen_key = True
+            run_len = 1
+        else:
+            run_len += 1
+        longest = max(longest, run_len)
+    return seen_key and longest <= PROXY_GOP
+
+def is_already_standard(src: pathlib.Path) -> bool:
+    """True if the source already matches what build_proxy would produce
+    (1920 wide, constant 30fps, square pixels, H.264 yuv420p, no rotation)."""
+    try:
+        out = subprocess.check_output(
+            [FFPROBE_CMD,"-v","error","-select_streams","v:0",
+             "-show_entries","stream=codec_name,width,height,pix_fmt,r_frame_rate,avg_frame_rate,"
+             "sample_aspect_ratio:stream_tags=rotate:stream_side_data=rotation",
+             "-of","json",str(src)],
+            text=True)
+        st = json.loads(out)["streams"][0]
+    except (OSError, subprocess.CalledProcessError, ValueError, KeyError, IndexError):
+        return False
+    rotated = int(st.get("tags", {}).get("rotate", 0) or 0) or any(
+        sd.get("rotation") for sd in st.get("side_data_list", []))
+    return (st.get("codec_name") == "h264" and st.get("pix_fmt") == "yuv420p"
+            and st.get("width") == TARGET_W and st.get("height", 1) % 2 == 0
+            # VFR phone footage reports r_frame_rate 30/1 but a different
+            # average; it needs the fps filter, not a stream copy
+            and _is_target_fps(st.get("r_frame_rate", "0/1"))
+            and _is_target_fps(st.get("avg_frame_rate", "0/1"))
+            and st.get("sample_aspect_ratio", "1:1") in ("1:1", "0:1", "N/A")
+            and not rotated)
+
+def build_proxy(src: pathlib.Path, dst: pathlib.Path, hw_encoder: str | None = None,
+                preset: str = PRESET, crf: int = CRF, proxy_codec: str = PROXY_CODEC):
+    """Standardize to 1920x?, 30fps, setsar=1, -noautorotate, H.264 (or MJPEG), video-only."""
+    if (proxy_codec == "h264" and preset == PRESET and crf == CRF
+            and is_already_standard(src) and has_short_gop(src)):
+        # Nothing to re-encode: copy the video stream into the proxy container.
+        # An explicit --preset/--crf asks for an encode, and a long source GOP
+        # would make seeks slow, so both of those go through libx264 instead.
+        run([FFMPEG_CMD,"-y","-i",str(src),"-map","0:v:0","-c:v","copy",
+             "-movflags","+faststart","-an",str(dst)])
+        meta = read_mp4_moov_head(dst) or probe_proxy_meta(dst)
+        if meta is not None:
+            save_proxy_meta(dst, meta)
+        return
     vf = f"scale={TARGET_W}:-2:flags=bicubic,fps={FPS},setsar=1"
-    run([FFMPEG_CMD,"-y","-noautorotate","-i",str(src),
-         "-vf",vf,
-         "-c:v","libx264","-preset","veryfast","-crf",str(CRF),
-         "-pix_fmt","yuv420p",
-         "-an",
-         str(dst)])
+    pre_input: list[str] = []
+    if proxy_codec == "mjpeg":
+        hw_encoder = None
+        codec = ["-c:v","mjpeg","-q:v","3","-pix_fmt","yuvj420p"]
+    elif hw_encoder and proxy_codec == "h264":
+        pre_input, vf, codec = hw_encoder_args(hw_encoder, vf)
+        codec += ["-g",str(PROXY_GOP)]
+    else:
+        hw_encoder = None
+        codec = ["-c:v","libx264","-preset",preset,"-crf",str(crf),"-pix_fmt","yuv420p"]
+        if proxy_codec == "h264-allintra":
+            codec += ["-g","1","-keyint_min","1","-sc_threshold","0","-bf","0"]
+        else:
+            codec += ["-g",str(PROXY_GOP)]
+    try:
+        run([FFMPEG_CMD,"-y",*pre_input,"-noautorotate","-i",str(src),
+             "-vf",vf,
+             *codec,
+             "-movflags","+faststart",
+             "-an",
+             str(dst)])
+    except RuntimeError:
+        if not hw_encoder:
+            raise
+        # Encoder is listed but unusable (no device/driver): use libx264
+        print(f"{hw_encoder} failed for {src.name}; retrying with libx264")
+        build_proxy(src, dst, preset=preset, crf=crf, proxy_codec=proxy_codec)
+        return
+    meta = read_mp4_moov_head(dst) or probe_proxy_meta(dst)
+    if meta is not None:
+        save_proxy_meta(dst, meta)
+
+def proxy_meta_path(proxy: pathlib.Path) -> pathlib.Path:
+    return proxy.with_suffix(".meta.json")
+
+def probe_proxy_meta(proxy: pathlib.Path):
+    """Read proxy size/fps/duration with ffprobe. Returns (fps, total_frames, w, h, dur) or None.
+
+    The proxy is encoded at a constant FPS, so the frame count follows from the
+    container duration; no need for -count_frames, which decodes the whole file.
+    """
+    try:
+        out = subprocess.check_output(
+            [FFPROBE_CMD,"-v","error","-select_streams","v:0",
+             "-show_entries","stream=r_frame_rate,width,height:format=duration",
+             "-of","json",str(proxy)],
+            text=True)
+        info = json.loads(out)
+        st = info["streams"][0]
+        num, _, den = st["r_frame_rate"].partition("/")
+        fps = float(num) / float(den or 1)
+        dur = float(info["format"]["duration"])
+    except (OSError, subprocess.CalledProcessError, ValueError, KeyError, IndexError, ZeroDivisionError):
+        return None
+    total_frames = int(round(dur * fps))
+    return fps, total_frames, int(st["width"]), int(st["height"]), dur
+
+def _mp4_boxes(buf, start: int, end: int):
+    """Yield (type, body_start, body_end) for the ISO-BMFF boxes in buf[start:end]."""
+    pos = start
+    while pos + 8 <= end:
+        size, typ = struct.unpack_from(">I4s", buf, pos)
+        hdr = 8
+        if size == 1:
+            if pos + 16 > end:
+                return
+            size = struct.unpack_from(">Q", buf, pos + 8)[0]
+            hdr = 16
+        elif size == 0:
+            size = end - pos
+        if size < hdr:
+            return
+        yield typ, pos + hdr, min(pos + size, end)
+        pos += size
+
+def read_mp4_moov_head(path: pathlib.Path):
+    """Read size and duration straight from the proxy's moov atom, without ffprobe.
+
+    Returns (fps, total_frames, w, h, dur) or None if the file can't be parsed.
+    Proxies are encoded at a constant FPS with +faststart, so moov sits near the
+    front and the frame count follows from the duration. The file is mapped,
+    not read, so only the pages holding the box headers are touched.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            moov = next(((b, e) for t, b, e in _mp4_boxes(buf, 0, len(buf)) if t == b"moov"), None)
+            if moov is None:
+                return None
+            dur = None
+            w = h = 0
+            for typ, b, e in _mp4_boxes(buf, *moov):
+                if typ == b"mvhd":
+                    if buf[b] == 1:
+                        timescale, duration = struct.unpack_from(">IQ", buf, b + 20)
+                    else:
+                        timescale, duration = struct.unpack_from(">II", buf, b + 12)
+                    if timescale:
+                        dur = duration / timescale
+                elif typ == b"trak" and not w:
+                    for sub, sb, se in _mp4_boxes(buf, b, e):
+                        if sub == b"tkhd":
+                            # Track width/height: the last 8 bytes, 16.16 fixed point
+                            tw, th = struct.unpack_from(">II", buf, se - 8)
+                            w, h = tw >> 16, th >> 16
+    except (OSError, ValueError, struct.error):
+        return None
+    if dur is None or not w or not h:
+        return None
+    return float(FPS), int(round(dur * FPS)), w, h, dur
+
+def save_proxy_meta(proxy: pathlib.Path, meta):
+    fps, total_frames, w, h, dur = meta
+    proxy_meta_path(proxy).write_text(json.dumps(
+        {"fps": fps, "total_frames": total_frames, "width": w, "height": h, "duration": dur}))
+
+def load_proxy_meta(proxy: pathlib.Path):
+    """Read the sidecar written next to the proxy, ignoring it if the proxy is newer."""
+    meta_path = proxy_meta_path(proxy)
+    try:
+        if meta_path.stat().st_mtime < proxy.stat().st_mtime:
+            return None
+        m = json.loads(meta_path.read_text())
+        return (float(m["fps"]), int(m["total_frames"]), int(m["width"]),
+                int(m["height"]), float(m["duration"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
 def get_meta(cap):
     fps = cap.get(cv2.CAP_PROP_FPS) or FPS
@@ -214,18 +509,398 @@ def get_meta(cap):
 
 def clamp(v, a, b): return max(a, min(b, v))
 
-def draw_hud(frame, t, fps, frame_idx, total_frames, rate, paused,
+def read_key(delay: int) -> int:
+    """Wait for a key; -1 if none, full code for arrows, low byte for everything else."""
+    key = cv2.waitKeyEx(delay)
+    if key == -1 or key in ARROW_KEYS:
+        return key
+    return key & 0xFF
+
+class CvReader:
+    """Proxy reader backed by cv2.VideoCapture (fallback when PyAV is missing)."""
+
+    def __init__(self, path: pathlib.Path):
+        # Explicit backend: skip probing GStreamer/V4L2/MSMF first
+        self.cap = cv2.VideoCapture(str(path), cv2.CAP_FFMPEG)
+        # Don't queue frames ahead of the one asked for (backends that
+        # don't support it ignore this)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def meta(self):
+        return get_meta(self.cap)
+
+    def grab(self) -> bool:
+        return self.cap.grab()
+
+    def read(self):
+        return self.cap.read()
+
+    def set_output_size(self, size: tuple[int, int]):
+        """No-op: OpenCV can't scale while decoding; frames are resized afterwards."""
+
+    def seek_frame(self, n: int, exact: bool = True):
+        """Seek to frame n and decode it. Returns (frame_index, frame) or (None, None)."""
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, n)
+        ok, frame = self.cap.read()
+        return (n, frame) if ok else (None, None)
+
+    def release(self):
+        self.cap.release()
+
+class PyAVReader:
+    """Proxy reader backed by PyAV, with timestamp-based seeking.
+
+    seek_frame(n, exact=False) returns the keyframe at or before n (cheap,
+    used while scrubbing during playback); exact=True decodes forward from that
+    keyframe until frame n is reached.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.container = av.open(str(path))
+        self.stream = self.container.streams.video[0]
+        # Frame + slice threading inside libavcodec
+        self.stream.thread_type = "AUTO"
+        self.time_base = self.stream.time_base
+        self.fps = float(self.stream.average_rate or FPS)
+        self._decoder = self.container.decode(self.stream)
+        self._reformat = {"format": "bgr24"}
+
+    def isOpened(self) -> bool:
+        return True
+
+    def set_output_size(self, size: tuple[int, int]):
+        """Have libswscale scale to size as part of the YUV->BGR conversion."""
+        self._reformat = {"format": "bgr24", "width": size[0], "height": size[1],
+                          "interpolation": "BILINEAR"}
+
+    def meta(self):
+        w = self.stream.codec_context.width or TARGET_W
+        h = self.stream.codec_context.height or 1080
+        total_frames = self.stream.frames
+        if not total_frames and self.stream.duration is not None:
+            total_frames = int(round(float(self.stream.duration * self.time_base) * self.fps))
+        total_frames = int(total_frames or 0)
+        dur = total_frames / self.fps if total_frames > 0 else 0.0
+        return self.fps, total_frames, w, h, dur
+
+    def _next(self):
+        try:
+            return next(self._decoder)
+        except (StopIteration, av.error.FFmpegError):
+            return None
+
+    def _index_of(self, frame) -> int:
+        return int(round(float(frame.pts * self.time_base) * self.fps))
+
+    def grab(self) -> bool:
+        return self._next() is not None
+
+    def read(self):
+        frame = self._next()
+        if frame is None:
+            return False, None
+        return True, frame.to_ndarray(**self._reformat)
+
+    def seek_frame(self, n: int, exact: bool = True):
+        """Seek to frame n and decode it. Returns (frame_index, frame) or (None, None)."""
+        target = int(n / self.fps / self.time_base)
+        self.container.seek(target, backward=True, any_frame=False, stream=self.stream)
+        self._decoder = self.container.decode(self.stream)
+        while True:
+            frame = self._next()
+            if frame is None:
+                return None, None
+            idx = n if frame.pts is None else self._index_of(frame)
+            if not exact or idx >= n:
+                return idx, frame.to_ndarray(**self._reformat)
+
+    def release(self):
+        self.container.close()
+
+class ProxyDecoder:
+    """Decodes and scales proxy frames ahead of the UI on a background thread.
+
+    Used during playback so decoding overlaps with drawing and imshow. The
+    reader is shared with the paused (synchronous) path: `lock` guards it, and
+    the thread only reads ahead between start() and stop(). Frames from before
+    the latest start()/stop() are dropped, so seeks never show stale frames.
+    """
+
+    def __init__(self, reader, size: tuple[int, int], use_opencl: bool = False, depth: int = 4):
+        self.reader = reader
+        self.size = size
+        self.use_opencl = use_opencl
+        self.lock = threading.Lock()
+        self.frames: queue.Queue = queue.Queue(maxsize=depth)
+        self.last_decoded = -1  # reader position: index of the last frame read
+        self.last_raw = None
+        self._gen = 0           # bumped on every start()/stop()
+        self._job = None        # (gen, next_frame, step) while reading ahead
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def start(self, first_frame: int, step: int, decoded_frame: int, frame):
+        """Read ahead from first_frame, every step-th frame. decoded_frame/frame
+        describe where the reader is: where the synchronous path left it, or
+        what stop() returned. Only call this while stopped."""
+        with self.lock:
+            self._gen += 1
+            self._job = (self._gen, first_frame, step)
+            self.last_decoded, self.last_raw = decoded_frame, frame
+        self._drain()
+        self._wake.set()
+
+    def stop(self):
+        """Stop reading ahead. Returns (last_decoded, last_raw) for the caller."""
+        with self.lock:
+            self._gen += 1
+            self._job = None
+            position = self.last_decoded, self.last_raw
+        self._drain()
+        return position
+
+    def get(self, timeout: float):
+        """Next (frame_index, display_frame); (None, None) at end of file; None if not ready."""
+        try:
+            while True:
+                gen, idx, disp = self.frames.get(timeout=timeout)
+                if gen == self._gen:
+                    return idx, disp
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self._closed = True
+        self.stop()
+        self._wake.set()
+        self._thread.join(timeout=1.0)
+
+    def _drain(self):
+        try:
+            while True:
+                self.frames.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait()
+            with self.lock:
+                if self._job is None:
+                    self._wake.clear()
+                    continue
+                gen, n, step = self._job
+                gap = n - self.last_decoded
+                if self.last_raw is not None and 1 <= gap <= GRAB_SKIP_MAX:
+                    for _ in range(gap - 1):
+                        self.reader.grab()
+                    ok, raw = self.reader.read()
+                    idx = n
+                else:
+                    # Decode forward to n itself so resuming or scrubbing
+                    # never jumps back to the previous keyframe
+                    idx, raw = self.reader.seek_frame(n)
+                    ok = raw is not None
+                if ok:
+                    self.last_decoded, self.last_raw = idx, raw
+                    self._job = (gen, idx + step, step)
+                else:
+                    self._job = None
+            item = (gen, idx, resize_for_display(raw, self.size, self.use_opencl)) if ok else (gen, None, None)
+            while not self._closed and gen == self._gen:
+                try:
+                    self.frames.put(item, timeout=0.05)
+                    break
+                except queue.Full:
+                    pass
+
+def probe_source(src: pathlib.Path):
+    """(width, height, duration) of a source clip via ffprobe, or None."""
+    try:
+        out = subprocess.check_output(
+            [FFPROBE_CMD,"-v","error","-select_streams","v:0",
+             "-show_entries","stream=width,height:format=duration",
+             "-of","json",str(src)],
+            text=True)
+        info = json.loads(out)
+        st = info["streams"][0]
+        return int(st["width"]), int(st["height"]), float(info["format"]["duration"])
+    except (OSError, subprocess.CalledProcessError, ValueError, KeyError, IndexError):
+        return None
+
+class PipeReader:
+    """Proxy-equivalent frames streamed from the source clip through ffmpeg.
+
+    Used for short clips (--stream-under) so marking can start without
+    writing a proxy first. ffmpeg applies the same scale/fps filters as
+    build_proxy and writes raw BGR frames at display size to a pipe; seeking
+    restarts it with -ss. Coordinates and frame numbers are those of the proxy
+    that build_proxy will produce.
+    """
+
+    def __init__(self, src: pathlib.Path):
+        self.src = src
+        self.proc = None
+        self.pos = -1  # index of the next frame the pipe will deliver
+        probed = probe_source(src)
+        if probed is None:
+            self.w = self.h = 0
+            return
+        src_w, src_h, self.dur = probed
+        # Same geometry as scale=TARGET_W:-2 in build_proxy
+        self.w = TARGET_W
+        self.h = max(2, int(round(src_h * TARGET_W / src_w / 2)) * 2)
+        self.total_frames = int(round(self.dur * FPS))
+        self.out_size = (self.w, self.h)
+
+    def isOpened(self) -> bool:
+        return self.w > 0
+
+    def meta(self):
+        return float(FPS), self.total_frames, self.w, self.h, self.dur
+
+    def set_output_size(self, size: tuple[int, int]):
+        self.out_size = size
+        self._stop()
+
+    def _start(self, n: int):
+        self._stop()
+        ow, oh = self.out_size
+        self.proc = subprocess.Popen(
+            [FFMPEG_CMD,"-v","error","-noautorotate","-ss",f"{n / FPS:.3f}","-i",str(self.src),
+             "-vf",f"scale={ow}:{oh}:flags=bicubic,fps={FPS},setsar=1",
+             "-an","-f","rawvideo","-pix_fmt","bgr24","pipe:1"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.pos = n
+
+    def _stop(self):
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+        self.pos = -1
+
+    def read(self):
+        if self.proc is None:
+            self._start(max(0, self.pos))
+        ow, oh = self.out_size
+        nbytes = ow * oh * 3
+        data = self.proc.stdout.read(nbytes)
+        if len(data) < nbytes:
+            return False, None
+        self.pos += 1
+        return True, np.frombuffer(data, dtype=np.uint8).reshape(oh, ow, 3)
+
+    def grab(self) -> bool:
+        return self.read()[0]
+
+    def seek_frame(self, n: int, exact: bool = True):
+        """Seek to frame n and decode it. Returns (frame_index, frame) or (None, None)."""
+        if n != self.pos or self.proc is None:
+            self._start(n)
+        ok, frame = self.read()
+        return (n, frame) if ok else (None, None)
+
+    def release(self):
+        self._stop()
+
+def open_proxy_reader(path: pathlib.Path):
+    if AV_AVAILABLE:
+        try:
+            return PyAVReader(path)
+        except (OSError, av.error.FFmpegError) as e:
+            print(f"PyAV could not open {path.name} ({e}); falling back to OpenCV")
+    return CvReader(path)
+
+def resize_for_display(frame, size, use_opencl: bool = False):
+    """Scale a decoded proxy frame to the window size, on the GPU via OpenCL if enabled."""
+    if frame.shape[1] == size[0] and frame.shape[0] == size[1]:
+        return frame  # already scaled while decoding (PyAV)
+    if use_opencl:
+        return cv2.resize(cv2.UMat(frame), size, interpolation=cv2.INTER_LINEAR).get()
+    return cv2.resize(frame, size, interpolation=cv2.INTER_LINEAR)
+
+# Rendered HUD text strips keyed by string, so lines that rarely change
+# (radius/trims/spot/zoom) aren't re-rasterized every frame
+HUD_TEXT_CACHE_SIZE = 16
+_hud_text_cache: "OrderedDict[str, tuple[Any, int]]" = OrderedDict()
+
+def put_cached_text(img, text: str, org: tuple[int, int]):
+    """Draw white HUD text like cv2.putText, reusing a pre-rendered strip.
+
+    The strip is white-on-black and is combined with cv2.max, which matches
+    putText for white text apart from slightly lighter anti-aliased edges.
+    """
+    entry = _hud_text_cache.get(text)
+    if entry is None:
+        (tw, th), base = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)
+        pad = 4
+        strip = np.zeros((th + base + 2 * pad, tw + 2 * pad, 3), dtype=np.uint8)
+        cv2.putText(strip, text, (pad, th + pad), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255,255,255), 2, cv2.LINE_AA)
+        entry = (strip, th + pad)
+        _hud_text_cache[text] = entry
+        if len(_hud_text_cache) > HUD_TEXT_CACHE_SIZE:
+            _hud_text_cache.popitem(last=False)
+    else:
+        _hud_text_cache.move_to_end(text)
+    strip, ascent = entry
+    x0, y0 = org[0] - 4, org[1] - ascent
+    ih, iw = img.shape[:2]
+    sx0, sy0 = max(0, -x0), max(0, -y0)
+    x1, y1 = min(iw, x0 + strip.shape[1]), min(ih, y0 + strip.shape[0])
+    if x1 <= x0 + sx0 or y1 <= y0 + sy0:
+        return
+    roi = img[y0 + sy0:y1, x0 + sx0:x1]
+    cv2.max(roi, strip[sy0:sy0 + roi.shape[0], sx0:sx0 + roi.shape[1]], dst=roi)
+
+# Ring masks keyed by display radius; the ring only changes size on +/-,
+# the mouse wheel or a zoom change, so it is rasterized once per radius
+RING_CACHE_SIZE = 8
+RING_COLOR = np.array((0, 0, 255), dtype=np.uint8)
+_ring_cache: "OrderedDict[int, Any]" = OrderedDict()
+
+def draw_cached_ring(img, center: tuple[int, int], radius: int):
+    """Draw the marker ring like cv2.circle(img, center, radius, red, 3).
+
+    Pixel-identical while the ring is fully on screen; where it runs off the
+    edge, cv2.circle clips with its own rasterizer and may differ by a pixel.
+    """
+    mask = _ring_cache.get(radius)
+    if mask is None:
+        r = radius + 3  # room for the 3px stroke
+        m = np.zeros((2 * r + 1, 2 * r + 1), dtype=np.uint8)
+        cv2.circle(m, (r, r), radius, 255, 3)
+        mask = (m > 0)[:, :, None]
+        _ring_cache[radius] = mask
+        if len(_ring_cache) > RING_CACHE_SIZE:
+            _ring_cache.popitem(last=False)
+    else:
+        _ring_cache.move_to_end(radius)
+    r = mask.shape[0] // 2
+    x0, y0 = center[0] - r, center[1] - r
+    ih, iw = img.shape[:2]
+    sx0, sy0 = max(0, -x0), max(0, -y0)
+    x1, y1 = min(iw, x0 + mask.shape[1]), min(ih, y0 + mask.shape[0])
+    if x1 <= x0 + sx0 or y1 <= y0 + sy0:
+        return
+    roi = img[y0 + sy0:y1, x0 + sx0:x1]
+    np.copyto(roi, RING_COLOR, where=mask[sy0:sy0 + roi.shape[0], sx0:sx0 + roi.shape[1]])
+
+def draw_hud(dst, t, fps, frame_idx, total_frames, rate, paused,
              radius_disp, start_trim, end_trim, spot_time, spot_frame, marker_disp, zoom=1.0):
-    overlay = frame.copy()
+    """Draw the HUD text and marker ring onto dst in place."""
     line1 = f"t={t:.2f}s  fps={fps:.2f}  frame={frame_idx}/{max(0,total_frames-1)}  rate={rate:.2f}x  {'PAUSED' if paused else 'PLAY'}"
     zoom_str = f"zoom={zoom:.1f}x  " if zoom > 1.0 else ""
     line2 = f"{zoom_str}radius={radius_disp}px  start_trim={start_trim:.2f}s  end_trim={end_trim:.2f}s  spot={spot_time:.2f}s  spot_f={spot_frame if spot_frame is not None else '-'}"
-    cv2.putText(overlay, line1, (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255,255,255), 2, cv2.LINE_AA)
-    cv2.putText(overlay, line2, (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255,255,255), 2, cv2.LINE_AA)
+    cv2.putText(dst, line1, (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255,255,255), 2, cv2.LINE_AA)
+    put_cached_text(dst, line2, (20, 80))
     if marker_disp:
-        cv2.circle(overlay, marker_disp, radius_disp, (0,0,255), 3)
-    cv2.addWeighted(overlay, 1.0, frame, 0.0, 0, frame)
-    return frame
+        draw_cached_ring(dst, marker_disp, radius_disp)
 
 def find_intro_files(intro_dir: pathlib.Path) -> dict:
     """Find image and video files in the intro directory."""
@@ -238,13 +913,14 @@ def find_intro_files(intro_dir: pathlib.Path) -> dict:
     images = []
     videos = []
     
-    for file in intro_dir.iterdir():
-        if file.is_file():
-            ext = file.suffix.lower()
-            if ext in image_exts:
-                images.append(file)
-            elif ext in video_exts:
-                videos.append(file)
+    with os.scandir(intro_dir) as it:
+        for entry in it:
+            if entry.is_file():
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in image_exts:
+                    images.append(pathlib.Path(entry.path))
+                elif ext in video_exts:
+                    videos.append(pathlib.Path(entry.path))
     
     return {"images": sorted(images), "videos": sorted(videos)}
 
@@ -285,209 +961,375 @@ def choose_intro_media(intro_files: dict) -> pathlib.Path | None:
         print("Invalid choice. Try again.")
 
 def autosave(project_path: pathlib.Path, project: Dict[str, Any]):
-    project_path.write_text(json.dumps(project, indent=2))
+    # Compact and atomic; the final save in main() writes the indented form
+    atomic_write_json(project_path, project, indent=False)
     print(f"  ↳ autosaved {project_path}")
 
-def mark_on_proxy(orig_path: pathlib.Path, proxy_path: pathlib.Path, clip_index: int):
-    cap = cv2.VideoCapture(str(proxy_path))
-    if not cap.isOpened():
-        print(f"Could not open proxy: {proxy_path}")
+# Accepted marks are appended here as they happen, so a crash or Ctrl+C
+# mid-session loses nothing; project.json is written once at the end and
+# the journal removed.
+MARKS_JOURNAL = "marks.jsonl"
+
+def append_mark(journal: pathlib.Path, filename: str, data: Dict[str, Any]):
+    with open(journal, "ab") as f:
+        f.write(jsonio.dumps({"clip": filename, "data": data}, indent=False) + b"\n")
+
+def load_marks_journal(journal: pathlib.Path) -> Dict[str, Dict[str, Any]]:
+    """Marks left by an interrupted session, by clip filename (latest wins)."""
+    marks: Dict[str, Dict[str, Any]] = {}
+    try:
+        with open(journal, "rb") as f:
+            for line in f:
+                try:
+                    entry = jsonio.loads(line)
+                    marks[entry["clip"]] = entry["data"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue  # torn final line from the crash
+    except FileNotFoundError:
+        pass
+    return marks
+
+@dataclass(slots=True)
+class MarkState:
+    """What the user has set for the clip being marked.
+
+    Shared by the key loop and the mouse callback; attribute access on a
+    slotted instance avoids nonlocal cell lookups in the closure.
+    """
+    current_frame: int = 0
+    playing: bool = True
+    rate_idx: int = 2
+    radius: int = 72
+    marker: tuple[int, int] = (0, 0)
+    spot_time: float = 0.0
+    spot_frame_std: int | None = None
+    start_trim: float = 0.0
+    end_trim: float = 0.0
+    zoom: float = 1.0
+
+def mark_on_proxy(orig_path: pathlib.Path, proxy_path: pathlib.Path, clip_index: int,
+                  use_opencl: bool = False, stream: bool = False):
+    """Interactive marking UI. With stream=True, frames come straight from
+    orig_path (PipeReader) and proxy_path is built by the caller afterwards."""
+    reader = PipeReader(orig_path) if stream else open_proxy_reader(proxy_path)
+    if not reader.isOpened():
+        print(f"Could not open {'clip' if stream else 'proxy'}: {orig_path if stream else proxy_path}")
         return None
 
-    fps, total_frames, w, h, dur = get_meta(cap)
+    if use_opencl:
+        use_opencl = cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(use_opencl)
+        if not use_opencl:
+            print("OpenCL not available; scaling frames on the CPU")
+
+    if stream:
+        meta = reader.meta()
+    else:
+        meta = load_proxy_meta(proxy_path)
+        if meta is None:
+            # No sidecar (proxy from an older run): parse the moov atom, then
+            # one ffprobe call; the reader's own property queries come last.
+            meta = read_mp4_moov_head(proxy_path) or probe_proxy_meta(proxy_path) or reader.meta()
+            if meta[1] > 0:
+                save_proxy_meta(proxy_path, meta)
+    fps, total_frames, w, h, dur = meta
+    # Key-handler constants, worked out once per clip
+    last_frame = max(0, total_frames - 1)
+    seek_small, seek_big = int(0.5 * fps), int(5 * fps)
 
     disp_max_w, disp_max_h = 1280, 720
     scale = min(disp_max_w / w, disp_max_h / h, 1.0)
     disp_w, disp_h = int(round(w * scale)), int(round(h * scale))
+    reader.set_output_size((disp_w, disp_h))
 
     win = f"[{clip_index}] {orig_path.name}"
     cv2.namedWindow(win, cv2.WINDOW_NORMAL)
     cv2.resizeWindow(win, disp_w, disp_h)
 
-    current_frame = 0
-    playing = True
+    st = MarkState(marker=(w//2, h//2))
+    decoded_frame = -1  # index of the frame currently held in `frame`
+    frame = None
+    frame_cache = OrderedDict()  # frame index -> display-sized frame (LRU)
     rate_options = [0.25, 0.5, 1.0, 1.5, 2.0, 4.0]
-    rate_idx = 2
-    radius = 72
-    marker = (w//2, h//2)
-    spot_time = 0.0
-    spot_frame_std = None
-    start_trim = 0.0
-    end_trim = 0.0
-    zoom = 1.0
+    # Composited display frame, allocated once and refilled every frame
+    disp_buf = np.empty((disp_h, disp_w, 3), dtype=np.uint8)
+    zoom_rect_for, zoom_rect = None, None  # zoom level -> visible area in display coords
+    ring_disp_for = None  # (marker, radius) that marker_disp/radius_disp were scaled from
+    last_view = None  # state the window was last drawn with
+    decoder = ProxyDecoder(reader, (disp_w, disp_h), use_opencl)
+    play_job = None  # (frame shown, step) the decoder is reading ahead from
+    next_due = 0.0  # time.monotonic() at which the next playback frame is shown
+
+    inv_scale = 1.0 / max(scale, 1e-6)
 
     def on_mouse(event, x, y, flags, param):
-        nonlocal marker, radius
+        if event == cv2.EVENT_MOUSEMOVE:
+            return
         if event == cv2.EVENT_LBUTTONDOWN:
-            fx = int(round(x / max(scale, 1e-6)))
-            fy = int(round(y / max(scale, 1e-6)))
+            fx = int(round(x * inv_scale))
+            fy = int(round(y * inv_scale))
             fx = clamp(fx, 0, w - 1)
             fy = clamp(fy, 0, h - 1)
-            marker = (fx, fy)
+            st.marker = (fx, fy)
         elif event == cv2.EVENT_MOUSEWHEEL:
             step = 12 if (flags & cv2.EVENT_FLAG_SHIFTKEY) else 6
             if flags > 0:
-                radius = clamp(radius + step, RADIUS_MIN, RADIUS_MAX)
+                st.radius = clamp(st.radius + step, RADIUS_MIN, RADIUS_MAX)
             else:
-                radius = clamp(radius - step, RADIUS_MIN, RADIUS_MAX)
+                st.radius = clamp(st.radius - step, RADIUS_MIN, RADIUS_MAX)
 
     cv2.setMouseCallback(win, on_mouse)
 
+    # Arrow keys: Left/Right = -/+0.5s, Up/Down = -/+5s
+    scrub_delta = {KEY_LEFT: -seek_small, KEY_RIGHT: seek_small,
+                   KEY_UP: -seek_big, KEY_DOWN: seek_big}
+    pending_key = None
+
     print(f"\n=== Marking (proxy): {orig_path.name} ===")
     print("Space: play/pause | ,/. frame step | ←/→ ±0.5s | ↑/↓ ±5s | [/] speed | g goto | s set spot | a/b trims")
     print("+/- or mouse wheel to change radius (Shift+wheel = larger step), presets 1=40 2=60 3=72 4=90 5=120")
     print("</> zoom in/out (1.0-2.0x) | 0 reset zoom | Click to set ring | r reset | Enter accept | q/Esc skip")
 
     while True:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
-        ok, frame = cap.read()
-        if not ok:
-            current_frame = clamp(current_frame, 0, max(0, total_frames-1))
-            cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
-            ok, frame = cap.read()
-            playing = False
-            if not ok:
-                break
-
-        t = current_frame / fps if fps > 0 else 0.0
-        disp = cv2.resize(frame, (disp_w, disp_h), interpolation=cv2.INTER_LINEAR)
-
-        # Draw zoom preview overlay (darken area outside zoom region)
-        if zoom > 1.0:
-            visible_w = int(w / zoom)
-            visible_h = int(h / zoom)
-            cx, cy = w // 2, h // 2
-            left = cx - visible_w // 2
-            top = cy - visible_h // 2
-            right = cx + visible_w // 2
-            bottom = cy + visible_h // 2
-
-            # Convert to display coordinates
-            left_d = int(left * scale)
-            top_d = int(top * scale)
-            right_d = int(right * scale)
-            bottom_d = int(bottom * scale)
-
-            # Create semi-transparent overlay outside zoom area
-            overlay = disp.copy()
-            cv2.rectangle(overlay, (0, 0), (disp_w, top_d), (0, 0, 0), -1)  # Top
-            cv2.rectangle(overlay, (0, bottom_d), (disp_w, disp_h), (0, 0, 0), -1)  # Bottom
-            cv2.rectangle(overlay, (0, top_d), (left_d, bottom_d), (0, 0, 0), -1)  # Left
-            cv2.rectangle(overlay, (right_d, top_d), (disp_w, bottom_d), (0, 0, 0), -1)  # Right
-            cv2.addWeighted(overlay, 0.5, disp, 0.5, 0, disp)
-
-            # Draw border around visible area
-            cv2.rectangle(disp, (left_d, top_d), (right_d, bottom_d), (0, 255, 255), 2)
-
-        marker_disp = (int(round(marker[0] * scale)), int(round(marker[1] * scale)))
-        radius_disp = int(round(radius * scale))
-        disp = draw_hud(disp, t, fps, current_frame, total_frames,
-                        rate_options[rate_idx], not playing,
-                        radius_disp, start_trim, end_trim,
-                        spot_time, spot_frame_std, marker_disp, zoom)
-        cv2.imshow(win, disp)
-
-        if playing:
-            step = max(1, int(round(rate_options[rate_idx])))
-            current_frame = clamp(current_frame + step, 0, max(0, total_frames-1))
-
-        key = cv2.waitKey(1 if playing else 20) & 0xFF
-        if key == 255:
+        # Stop decoding ahead as soon as playback pauses (space, end of clip)
+        # and pick up the reader position it left behind.
+        if not st.playing and play_job is not None:
+            decoded_frame, frame = decoder.stop()
+            play_job = None
+
+        cached = None
+        view = (st.current_frame, st.marker, st.radius, st.zoom, st.rate_idx, st.playing,
+                st.start_trim, st.end_trim, st.spot_frame_std)
+        if st.playing:
+            # Frames come from the background decoder; restart it when
+            # playback starts, seeks or changes speed. Only the decoder knows
+            # where the reader is while it runs, so stop it first and hand
+            # the position it reports back to start().
+            step = max(1, int(round(rate_options[st.rate_idx])))
+            if play_job != (st.current_frame, step):
+                if play_job is not None:
+                    decoded_frame, frame = decoder.stop()
+                # Continue after current_frame only if it is already on
+                # screen: on resume, when the reader last decoded it (not at
+                # the start of a clip); mid-playback, unless an arrow key
+                # just moved it.
+                if play_job is None:
+                    shown = decoded_frame == st.current_frame
+                else:
+                    shown = play_job[0] == st.current_frame
+                first = st.current_frame + step if shown else st.current_frame
+                decoder.start(first, step, decoded_frame, frame)
+                play_job = (st.current_frame, step)
+                next_due = 0.0
+            now = time.monotonic()
+            item = decoder.get(timeout=0.05) if now >= next_due else None
+            if item is not None:
+                idx, cached = item
+                if idx is None:  # end of proxy
+                    st.playing = False
+                else:
+                    st.current_frame = idx
+                    play_job = (idx, step)
+                    # Each shown frame advances `step` frames of video. Keep
+                    # to the schedule when a frame is a little late; after a
+                    # restart or a long stall, schedule from now instead.
+                    frame_period = step / ((fps or FPS) * rate_options[st.rate_idx])
+                    next_due = (next_due if next_due > now - frame_period else now) + frame_period
+                    frame_cache[idx] = cached
+                    if len(frame_cache) > FRAME_CACHE_SIZE:
+                        frame_cache.popitem(last=False)
+        elif view != last_view:
+            # While paused, only decode and recomposite when something visible
+            # changed; otherwise just keep polling for input.
+            cached = frame_cache.get(st.current_frame)
+            if cached is not None:
+                frame_cache.move_to_end(st.current_frame)
+            else:
+                with decoder.lock:
+                    if st.current_frame != decoded_frame:
+                        gap = st.current_frame - decoded_frame
+                        if frame is not None and 1 <= gap <= GRAB_SKIP_MAX:
+                            # Short forward step ('.'): keep decoding from the
+                            # current position, skipping pixel conversion for
+                            # frames that will not be shown.
+                            for _ in range(gap - 1):
+                                reader.grab()
+                            ok, raw = reader.read()
+                            landed = st.current_frame if ok else None
+                        else:
+                            # Real jump (arrows, ',', 'g', backward step): seek once.
+                            landed, raw = reader.seek_frame(st.current_frame)
+                        if raw is None:
+                            # The frame count can overshoot the real end by a
+                            # frame or two; go back to the last frame shown.
+                            if decoded_frame < 0:
+                                break
+                            landed, raw = reader.seek_frame(decoded_frame)
+                            if raw is None:
+                                break
+                        frame = raw
+                        st.current_frame = decoded_frame = landed
+
+                cached = resize_for_display(frame, (disp_w, disp_h), use_opencl)
+                frame_cache[st.current_frame] = cached
+                if len(frame_cache) > FRAME_CACHE_SIZE:
+                    frame_cache.popitem(last=False)
+
+        if cached is not None:
+            t = st.current_frame / fps if fps > 0 else 0.0
+            np.copyto(disp_buf, cached)
+            disp = disp_buf
+
+            # Draw zoom preview overlay (darken area outside zoom region)
+            if st.zoom > 1.0:
+                if zoom_rect_for != st.zoom:
+                    visible_w = int(w / st.zoom)
+                    visible_h = int(h / st.zoom)
+                    cx, cy = w // 2, h // 2
+                    left = cx - visible_w // 2
+                    top = cy - visible_h // 2
+                    right = cx + visible_w // 2
+                    bottom = cy + visible_h // 2
+
+                    # Convert to display coordinates
+                    zoom_rect = (int(left * scale), int(top * scale),
+                                 int(right * scale), int(bottom * scale))
+                    zoom_rect_for = st.zoom
+                left_d, top_d, right_d, bottom_d = zoom_rect
+
+                # Halve brightness outside the zoom area (same as a 50% blend
+                # with black), in place on the four bands around it
+                disp[:top_d] >>= 1                      # Top
+                disp[bottom_d:] >>= 1                   # Bottom
+                disp[top_d:bottom_d, :left_d] >>= 1     # Left
+                disp[top_d:bottom_d, right_d:] >>= 1    # Right
+
+                # Draw border around visible area
+                cv2.rectangle(disp, (left_d, top_d), (right_d, bottom_d), (0, 255, 255), 2)
+
+            if ring_disp_for != (st.marker, st.radius):
+                marker_disp = (int(round(st.marker[0] * scale)), int(round(st.marker[1] * scale)))
+                radius_disp = int(round(st.radius * scale))
+                ring_disp_for = (st.marker, st.radius)
+            draw_hud(disp, t, fps, st.current_frame, total_frames,
+                     rate_options[st.rate_idx], not st.playing,
+                     radius_disp, st.start_trim, st.end_trim,
+                     st.spot_time, st.spot_frame_std, marker_disp, st.zoom)
+            cv2.imshow(win, disp)
+
+            last_view = (st.current_frame, st.marker, st.radius, st.zoom, st.rate_idx, st.playing,
+                         st.start_trim, st.end_trim, st.spot_frame_std)
+
+        if pending_key is not None:
+            key, pending_key = pending_key, None
+        else:
+            # During playback, wait for input until the next frame is due
+            key = read_key(max(1, int((next_due - time.monotonic()) * 1000)) if st.playing else 30)
+        if key == -1:
             continue
 
         if key in (ord('q'), 27):
-            cap.release()
+            decoder.close()
+            reader.release()
             cv2.destroyWindow(win)
             return None
         elif key == ord(' '):
-            playing = not playing
-        elif key == ord(',') and not playing:
-            current_frame = clamp(current_frame - 1, 0, max(0, total_frames-1))
-        elif key == ord('.') and not playing:
-            current_frame = clamp(current_frame + 1, 0, max(0, total_frames-1))
-        elif key == 81:   # Left
-            current_frame = clamp(current_frame - int(0.5 * fps), 0, max(0, total_frames-1))
-        elif key == 83:   # Right
-            current_frame = clamp(current_frame + int(0.5 * fps), 0, max(0, total_frames-1))
-        elif key == 82:   # Up
-            current_frame = clamp(current_frame - int(5 * fps), 0, max(0, total_frames-1))
-        elif key == 84:   # Down
-            current_frame = clamp(current_frame + int(5 * fps), 0, max(0, total_frames-1))
+            st.playing = not st.playing
+        elif key == ord(',') and not st.playing:
+            st.current_frame = clamp(st.current_frame - 1, 0, last_frame)
+        elif key == ord('.') and not st.playing:
+            st.current_frame = clamp(st.current_frame + 1, 0, last_frame)
+        elif key in scrub_delta:   # Arrows
+            # Latest value wins: fold auto-repeated arrow presses that are
+            # already queued into one seek instead of decoding each target.
+            delta = 0
+            while key in scrub_delta:
+                delta += scrub_delta[key]
+                key = read_key(1)
+            if key != -1:
+                pending_key = key
+            st.current_frame = clamp(st.current_frame + delta, 0, last_frame)
         elif key == ord('['):
-            rate_idx = max(0, rate_idx - 1)
+            st.rate_idx = max(0, st.rate_idx - 1)
         elif key == ord(']'):
-            rate_idx = min(len(rate_options)-1, rate_idx + 1)
+            st.rate_idx = min(len(rate_options)-1, st.rate_idx + 1)
         elif key == ord('g'):
             try:
                 secs = float(input("Go to time (seconds): ").strip())
-                current_frame = clamp(int(round(secs * fps)), 0, max(0, total_frames-1))
+                st.current_frame = clamp(int(round(secs * fps)), 0, last_frame)
             except Exception:
                 pass
         elif key == ord('s'):
-            spot_time = current_frame / fps if fps > 0 else 0.0
-            spot_frame_std = current_frame
-            print(f"spot_time = {spot_time:.3f}s  |  spot_frame_std = {spot_frame_std}")
+            st.spot_time = st.current_frame / fps if fps > 0 else 0.0
+            st.spot_frame_std = st.current_frame
+            print(f"spot_time = {st.spot_time:.3f}s  |  spot_frame_std = {st.spot_frame_std}")
         elif key == ord('a'):
-            start_trim = current_frame / fps if fps > 0 else 0.0
-            print(f"start_trim = {start_trim:.3f}s")
+            st.start_trim = st.current_frame / fps if fps > 0 else 0.0
+            print(f"start_trim = {st.start_trim:.3f}s")
         elif key == ord('b'):
-            now = current_frame / fps if fps > 0 else 0.0
-            end_trim = max(0.0, dur - now)
-            print(f"end_trim = {end_trim:.3f}s")
+            now = st.current_frame / fps if fps > 0 else 0.0
+            st.end_trim = max(0.0, dur - now)
+            print(f"end_trim = {st.end_trim:.3f}s")
         elif key == ord('+'):
-            radius = clamp(radius + 6, RADIUS_MIN, RADIUS_MAX)
+            st.radius = clamp(st.radius + 6, RADIUS_MIN, RADIUS_MAX)
         elif key == ord('-'):
-            radius = clamp(radius - 6, RADIUS_MIN, RADIUS_MAX)
-        elif key in (ord('1'), ord('2'), ord('3'), ord('4'), ord('5')):
-            presets = {ord('1'):40, ord('2'):60, ord('3'):72, ord('4'):90, ord('5'):120}
-            radius = presets[key]
-            print(f"radius preset -> {radius}px")
-        elif key == ord('<') or key == ord(',') and playing:  # < key (zoom out)
-            zoom = round(clamp(zoom - ZOOM_STEP, ZOOM_MIN, ZOOM_MAX), 1)
-            print(f"zoom = {zoom:.1f}x")
-        elif key == ord('>') or key == ord('.') and playing:  # > key (zoom in)
-            zoom = round(clamp(zoom + ZOOM_STEP, ZOOM_MIN, ZOOM_MAX), 1)
-            print(f"zoom = {zoom:.1f}x")
+            st.radius = clamp(st.radius - 6, RADIUS_MIN, RADIUS_MAX)
+        elif key in RADIUS_PRESETS:
+            st.radius = RADIUS_PRESETS[key]
+            print(f"radius preset -> {st.radius}px")
+        elif key == ord('<') or key == ord(',') and st.playing:  # < key (zoom out)
+            st.zoom = round(clamp(st.zoom - ZOOM_STEP, ZOOM_MIN, ZOOM_MAX), 1)
+            print(f"zoom = {st.zoom:.1f}x")
+        elif key == ord('>') or key == ord('.') and st.playing:  # > key (zoom in)
+            st.zoom = round(clamp(st.zoom + ZOOM_STEP, ZOOM_MIN, ZOOM_MAX), 1)
+            print(f"zoom = {st.zoom:.1f}x")
         elif key == ord('0'):  # Reset zoom
-            zoom = 1.0
+            st.zoom = 1.0
             print("zoom reset to 1.0x")
         elif key in (ord('r'), ord('R')):
-            marker = (w//2, h//2); radius = 72
-            start_trim = 0.0; end_trim = 0.0
-            spot_time = 0.0; spot_frame_std = None
-            zoom = 1.0
+            st.marker = (w//2, h//2); st.radius = 72
+            st.start_trim = 0.0; st.end_trim = 0.0
+            st.spot_time = 0.0; st.spot_frame_std = None
+            st.zoom = 1.0
             print("Reset marker, trims, spot, and zoom.")
         elif key == 13:  # Enter
-            if spot_frame_std is None:
-                spot_frame_std = current_frame
-                spot_time = current_frame / fps if fps > 0 else 0.0
-                print(f"(auto) spot_time = {spot_time:.3f}s  |  spot_frame_std = {spot_frame_std}")
+            if st.spot_frame_std is None:
+                st.spot_frame_std = st.current_frame
+                st.spot_time = st.current_frame / fps if fps > 0 else 0.0
+                print(f"(auto) spot_time = {st.spot_time:.3f}s  |  spot_frame_std = {st.spot_frame_std}")
             # Warn if marker may be outside zoomed region
-            if zoom > 1.0:
-                visible_w = int(w / zoom)
-                visible_h = int(h / zoom)
+            if st.zoom > 1.0:
+                visible_w = int(w / st.zoom)
+                visible_h = int(h / st.zoom)
                 cx, cy = w // 2, h // 2
                 left = cx - visible_w // 2
                 right = cx + visible_w // 2
                 top = cy - visible_h // 2
                 bottom = cy + visible_h // 2
-                if not (left <= marker[0] <= right and top <= marker[1] <= bottom):
-                    print(f"WARNING: Marker at ({marker[0]}, {marker[1]}) may be outside zoomed region!")
-            cap.release()
+                if not (left <= st.marker[0] <= right and top <= st.marker[1] <= bottom):
+                    print(f"WARNING: Marker at ({st.marker[0]}, {st.marker[1]}) may be outside zoomed region!")
+            decoder.close()
+            reader.release()
             cv2.destroyWindow(win)
             return {
                 "file": str(orig_path),
                 "std_file": str(proxy_path),
-                "marker_x_std": int(marker[0]),
-                "marker_y_std": int(marker[1]),
-                "radius_std": int(radius),
-                "start_trim": float(start_trim),
-                "end_trim": float(end_trim),
-                "spot_time": float(spot_time),
-                "spot_frame_std": int(spot_frame_std),
-                "zoom_std": float(zoom),
+                "marker_x_std": int(st.marker[0]),
+                "marker_y_std": int(st.marker[1]),
+                "radius_std": int(st.radius),
+                "start_trim": float(st.start_trim),
+                "end_trim": float(st.end_trim),
+                "spot_time": float(st.spot_time),
+                "spot_frame_std": int(st.spot_frame_std),
+                "zoom_std": float(st.zoom),
             }
 
+    # Proxy could not be decoded at all
+    decoder.close()
+    reader.release()
+    cv2.destroyWindow(win)
+    return None
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--athlete", type=str, help="Athlete folder name under ./athletes")
@@ -510,6 +1352,27 @@ def main():
     ap.add_argument("--overwrite", action="store_true", help="Overwrite existing project without asking")
     ap.add_argument("--all", action="store_true",
                     help="Re-mark all clips, ignoring existing marks (default: only mark new/unmarked)")
+    ap.add_argument("--jobs", type=int, default=0,
+                    help="Proxy builds to run at once (default: half the CPU cores)")
+    ap.add_argument("--preset", default=PRESET,
+                    choices=["ultrafast", "superfast", "veryfast", "faster", "fast", "medium"],
+                    help=f"libx264 preset for proxies (default: {PRESET})")
+    ap.add_argument("--crf", type=int, default=CRF,
+                    help=f"libx264 CRF for proxies (default: {CRF}; the renderer also reads the proxy)")
+    ap.add_argument("--proxy-codec", choices=PROXY_CODECS,
+                    default=PROXY_CODEC if PROXY_CODEC in PROXY_CODECS else "h264",
+                    help="Proxy codec: h264 (default), h264-allintra or mjpeg (all-intra: "
+                         "instant seeks/backward steps, 3-5x larger files)")
+    ap.add_argument("--stream-under", type=float, default=0, metavar="SECONDS",
+                    help="Mark clips up to this long directly from the source through an ffmpeg "
+                         "pipe, building their proxy only once accepted (default: off)")
+    ap.add_argument("--hwenc", choices=["auto", "on", "off"], default="off",
+                    help="Build proxies with a hardware H.264 encoder (NVENC/QSV/VideoToolbox/VAAPI): "
+                         "auto = use one if present, on = require one, off = libx264 (default)")
+    ap.add_argument("--force-rebuild", action="store_true",
+                    help="Rebuild proxies even when they are newer than their source clip")
+    ap.add_argument("--opencl", action="store_true",
+                    help="Scale proxy frames for display with OpenCL (GPU) when available")
 
     args = ap.parse_args()
 
@@ -609,7 +1472,7 @@ def main():
     # If project exists, handle accordingly
     if project_path.exists():
         try:
-            existing_project = json.loads(project_path.read_text())
+            existing_project = jsonio.loads(project_path.read_bytes())
         except json.JSONDecodeError as e:
             print(f"Error: project.json is corrupted: {e}")
             print("Please fix or delete the file and try again.")
@@ -751,6 +1614,11 @@ def main():
 
     # Build map of clips_in files for lookup
     clips_in_files = {src.name: src for src in clips}
+    # Clips already in project.json, by filename (built once, used for both
+    # picking clips to mark and merging the results back)
+    existing_by_name: Dict[str, Dict[str, Any]] = {}
+    if existing_project and not mark_all:
+        existing_by_name = {get_clip_filename(c): c for c in existing_project.get("clips", [])}
 
     # Determine which clips need marking, preserving project.json order
     clips_to_mark: List[pathlib.Path] = []
@@ -769,9 +1637,8 @@ def main():
                 clips_to_mark.append(clips_in_files[filename])
 
         # Also check for new clips in clips_in/ not in project.json
-        existing_filenames = {get_clip_filename(c) for c in existing_clips}
         for src in clips:
-            if src.name not in existing_filenames:
+            if src.name not in existing_by_name:
                 clips_to_mark.append(src)
     else:
         # Fresh project or --all mode - mark all clips
@@ -787,27 +1654,80 @@ def main():
     # Build a map for updating clips in place
     newly_marked: Dict[str, Dict[str, Any]] = {}
 
-    # Mark the clips that need it
-    for idx, src in enumerate(clips_to_mark, 1):
-        # Generate unique proxy filename based on source name
-        proxy_name = f"proxy_{src.stem}_std.mp4"
-        proxy = paths["prox"] / proxy_name
+    journal = paths["work"] / MARKS_JOURNAL
+    recovered = load_marks_journal(journal)
+    if recovered:
+        pending_names = {src.name for src in clips_to_mark}
+        newly_marked.update((name, data) for name, data in recovered.items() if name in pending_names)
+        if newly_marked:
+            print(f"Recovered {len(newly_marked)} clip(s) marked in an interrupted session.")
+            clips_to_mark = [src for src in clips_to_mark if src.name not in newly_marked]
+
+    # Start all missing proxy builds up front so clip 1 can be marked while the
+    # rest encode. Each build is its own ffmpeg process and libx264 is already
+    # multi-threaded, so by default only run half as many jobs as there are
+    # cores (--jobs overrides), and never more than there are proxies to build.
+    proxies = {src: proxy_path_for(paths["prox"], src, args.proxy_codec) for src in clips_to_mark}
+    max_workers = args.jobs or max(1, (os.cpu_count() or 2) // 2)
+
+    hw_encoder = None
+    if args.hwenc != "off":
+        hw_encoder = detect_hw_encoder()
+        if hw_encoder:
+            print(f"Using hardware encoder for proxies: {hw_encoder}")
+        elif args.hwenc == "on":
+            print("No hardware H.264 encoder found in this ffmpeg build.")
+            sys.exit(1)
 
-        # Check if proxy already exists and is valid
-        if proxy.exists():
+    to_build = []
+    to_stream = set()
+    for src, proxy in proxies.items():
+        if not args.force_rebuild and not needs_rebuild(src, proxy):
             print(f"Reusing existing proxy: {proxy.name}")
-        else:
-            try:
-                build_proxy(src, proxy)
-            except Exception as e:
-                print(f"Proxy build failed for {src.name}: {e}")
+            continue
+        if args.stream_under > 0:
+            probed = probe_source(src)
+            if probed is not None and probed[2] <= args.stream_under:
+                # Short clip: mark straight from the source; the proxy is only
+                # built if the clip is accepted
+                to_stream.add(src)
                 continue
+        to_build.append(src)
+
+    def submit_build(src):
+        return ex.submit(build_proxy, src, proxies[src], hw_encoder,
+                         args.preset, args.crf, args.proxy_codec)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_build) + len(to_stream)))) as ex:
+        pending = {src: submit_build(src) for src in to_build}
+
+        # Mark the clips that need it, waiting only on the proxy for this clip
+        for idx, src in enumerate(clips_to_mark, 1):
+            proxy = proxies[src]
+            if src in pending:
+                try:
+                    pending[src].result()
+                except Exception as e:
+                    print(f"Proxy build failed for {src.name}: {e}")
+                    continue
+
+            data = mark_on_proxy(src, proxy, idx, use_opencl=args.opencl, stream=src in to_stream)
+            if data is not None:
+                newly_marked[src.name] = data
+                append_mark(journal, src.name, data)
+                if src in to_stream:
+                    # Build the proxy the renderer reads while the next clip is marked
+                    pending[src] = submit_build(src)
+            else:
+                print(f"Skipped: {src.name}")
 
-        data = mark_on_proxy(src, proxy, idx)
-        if data is not None:
-            newly_marked[src.name] = data
-        else:
-            print(f"Skipped: {src.name}")
+        for src in to_stream:
+            if src in pending:
+                try:
+                    pending[src].result()
+                except Exception as e:
+                    # Marks are kept; render_highlight.py rebuilds a missing proxy
+                    print(f"Proxy build failed for {src.name}: {e}")
 
     # Update project clips, preserving order from project.json
     if existing_project and not mark_all:
@@ -826,9 +1746,8 @@ def main():
                 updated_clips.append(clip)
 
         # Append any new clips that weren't in project.json
-        existing_filenames = {get_clip_filename(c) for c in project.get("clips", [])}
         for filename, data in newly_marked.items():
-            if filename not in existing_filenames:
+            if filename not in existing_by_name:
                 updated_clips.append(data)
 
         project["clips"] = updated_clips
@@ -836,7 +1755,8 @@ def main():
         # Fresh project - just use newly marked clips
         project["clips"] = list(newly_marked.values())
 
-    project_path.write_text(json.dumps(project, indent=2))
+    atomic_write_json(project_path, project)
+    journal.unlink(missing_ok=True)
     newly_marked_count = len(newly_marked)
     print(f"\nSaved {project_path}. Marked {newly_marked_count} new clip(s).")
     print(f"Next: python render_highlight.py --dir \"{base}\"")
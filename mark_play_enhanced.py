@@ -41,10 +41,14 @@
 import argparse
 import cv2
 import json
+import os
 import pathlib
 import subprocess
 import sys
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 
@@ -56,6 +60,17 @@ except ImportError:
     # Fallback to system binary if ffmpeg_utils not available
     FFMPEG_CMD = "ffmpeg"
 
+# NVDEC decoding needs an OpenCV build with CUDA and the cudacodec module
+try:
+    CUDA_DECODE_AVAILABLE = (hasattr(cv2, "cudacodec")
+                             and cv2.cuda.getCudaEnabledDeviceCount() > 0)
+except cv2.error:
+    CUDA_DECODE_AVAILABLE = False
+
+# JSON read/atomic write helpers (use orjson when installed)
+from utils import jsonio
+from utils.jsonio import atomic_write_json
+
 ROOT = pathlib.Path.cwd()
 ATHLETES = ROOT / "athletes"
 TEMPLATES_DIR = ROOT / "templates"
@@ -63,9 +78,24 @@ TEMPLATES_DIR = ROOT / "templates"
 TARGET_W = 1920
 FPS = 30
 CRF = 18
+# Marking decodes a second, display-width proxy so frames need no resize;
+# marks are still stored in TARGET_W (std) coordinates
+DISPLAY_W = 1280
+DISPLAY_CRF = 20
 RADIUS_MIN = 6
 RADIUS_MAX = 600
+# Number keys 1-5 -> ring radius (std px)
+RADIUS_PRESETS = {ord('1'): 40, ord('2'): 60, ord('3'): 72, ord('4'): 90, ord('5'): 120}
+# Forward jumps up to this many frames (fast playback, '.' steps) are decoded
+# through with grab() instead of a CAP_PROP_POS_FRAMES seek
+GRAB_SKIP_MAX = 8
+# Decoded proxy frames kept (~2.7 MB each from the 1280x720 display proxy,
+# ~6 MB from a 1920x1080 std proxy) so scrubbing back over
+# recent frames and stepping back with ',' don't re-decode from a keyframe
+FRAME_CACHE_SIZE = 32
 VIDEO_EXTS = {".mp4", ".mov", ".m4v", ".mkv", ".avi", ".webm"}
+# Accepted clips between project.json checkpoints during a session
+AUTOSAVE_EVERY = 5
 
 # Enhanced playback speeds
 SPEED_OPTIONS = [0.1, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0, 4.0]
@@ -75,11 +105,16 @@ class PlayerTemplate:
 
     def __init__(self):
         TEMPLATES_DIR.mkdir(exist_ok=True)
+        # Template names, refreshed only when the directory's mtime changes
+        # (adding, removing or renaming a template updates it)
+        self._cache: Optional[List[str]] = None
+        self._cache_mtime = 0.0
 
     def save_template(self, name: str, player_data: Dict[str, Any]):
         """Save player profile as template"""
         template_file = TEMPLATES_DIR / f"{name}.json"
         template_file.write_text(json.dumps(player_data, indent=2))
+        self._cache = None  # don't rely on mtime resolution for our own writes
         print(f"Template saved: {name}")
 
     def load_template(self, name: str) -> Optional[Dict[str, Any]]:
@@ -91,7 +126,13 @@ class PlayerTemplate:
 
     def list_templates(self) -> List[str]:
         """List available templates"""
-        return [f.stem for f in TEMPLATES_DIR.glob("*.json")]
+        mtime = TEMPLATES_DIR.stat().st_mtime
+        if self._cache is None or mtime != self._cache_mtime:
+            with os.scandir(TEMPLATES_DIR) as it:
+                self._cache = [e.name[:-5] for e in it
+                               if e.name.endswith(".json") and e.is_file()]
+            self._cache_mtime = mtime
+        return list(self._cache)
 
 class ClipDetector:
     """Detects and manages new clips"""
@@ -100,14 +141,25 @@ class ClipDetector:
     def find_new_clips(clips_in: pathlib.Path, existing_clips: List[Dict]) -> List[pathlib.Path]:
         """Find clips not yet in project"""
         existing_files = {pathlib.Path(clip.get("file", "")).name for clip in existing_clips}
-        all_clips = [p for p in clips_in.iterdir() if p.suffix.lower() in VIDEO_EXTS]
-        return [clip for clip in all_clips if clip.name not in existing_files]
+        with os.scandir(clips_in) as it:
+            return [pathlib.Path(e.path) for e in it
+                    if e.name not in existing_files and e.is_file()
+                    and os.path.splitext(e.name)[1].lower() in VIDEO_EXTS]
 
     @staticmethod
     def suggest_processing_order(clips: List[pathlib.Path]) -> List[pathlib.Path]:
         """Suggest optimal processing order based on filename patterns"""
+        # Modification times from one scandir per folder (DirEntry.stat() is
+        # cached, and free on Windows) rather than a stat() per sort key
+        wanted = {str(c) for c in clips}
+        mtimes: Dict[str, float] = {}
+        for parent in {c.parent for c in clips}:
+            with os.scandir(parent) as it:
+                for e in it:
+                    if e.path in wanted:
+                        mtimes[e.path] = e.stat().st_mtime
         # Sort by modification time (newest first) and filename
-        return sorted(clips, key=lambda x: (x.stat().st_mtime, x.name.lower()), reverse=True)
+        return sorted(clips, key=lambda x: (mtimes.get(str(x), 0.0), x.name.lower()), reverse=True)
 
 class SmartDefaults:
     """Provides intelligent defaults based on previous clips"""
@@ -115,7 +167,10 @@ class SmartDefaults:
     def __init__(self):
         self.last_radius = 72
         self.last_position = (960, 540)  # Center
-        self.common_positions = []  # Track common player positions
+        self.common_positions = deque(maxlen=10)  # Track common player positions
+        # Running sum of the last 5 positions for get_suggested_position
+        self._recent = deque(maxlen=5)
+        self._recent_sum = [0, 0]
 
     def update_from_clip(self, clip_data: Dict[str, Any]):
         """Learn from completed clip"""
@@ -126,9 +181,13 @@ class SmartDefaults:
         )
         self.common_positions.append(self.last_position)
 
-        # Keep only last 10 positions
-        if len(self.common_positions) > 10:
-            self.common_positions = self.common_positions[-10:]
+        if len(self._recent) == self._recent.maxlen:
+            old_x, old_y = self._recent[0]
+            self._recent_sum[0] -= old_x
+            self._recent_sum[1] -= old_y
+        self._recent.append(self.last_position)
+        self._recent_sum[0] += self.last_position[0]
+        self._recent_sum[1] += self.last_position[1]
 
     def get_suggested_radius(self) -> int:
         """Get suggested radius based on history"""
@@ -137,57 +196,355 @@ class SmartDefaults:
     def get_suggested_position(self) -> Tuple[int, int]:
         """Get suggested position based on history"""
         if len(self.common_positions) >= 3:
-            # Return most common position area
-            positions = np.array(self.common_positions[-5:])
-            return tuple(map(int, np.mean(positions, axis=0)))
+            # Return most common position area (mean of the last 5)
+            n = len(self._recent)
+            return (int(self._recent_sum[0] / n), int(self._recent_sum[1] / n))
         return self.last_position
 
 class MarkerHistory:
     """Manages undo/redo for marker placement"""
 
     def __init__(self):
-        self.history = []
-        self.current_index = -1
+        # The current state is undo_stack[-1]; the deque bound drops the
+        # oldest states once max_history is reached
         self.max_history = 20
+        self.undo_stack = deque(maxlen=self.max_history)
+        self.redo_stack = []
 
     def add_state(self, marker: Tuple[int, int], radius: int):
         """Add new state to history"""
-        # Remove any future states if we're not at the end
-        if self.current_index < len(self.history) - 1:
-            self.history = self.history[:self.current_index + 1]
-
-        self.history.append({"marker": marker, "radius": radius})
-
-        # Limit history size
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
-            self.current_index = len(self.history) - 1
-        else:
-            self.current_index = len(self.history) - 1
+        # A new edit discards any states that were undone
+        self.redo_stack.clear()
+        self.undo_stack.append({"marker": marker, "radius": radius})
 
     def undo(self) -> Optional[Dict]:
         """Undo to previous state"""
-        if self.current_index > 0:
-            self.current_index -= 1
-            return self.history[self.current_index]
+        if len(self.undo_stack) > 1:
+            self.redo_stack.append(self.undo_stack.pop())
+            return self.undo_stack[-1]
         return None
 
     def redo(self) -> Optional[Dict]:
         """Redo to next state"""
-        if self.current_index < len(self.history) - 1:
-            self.current_index += 1
-            return self.history[self.current_index]
+        if self.redo_stack:
+            state = self.redo_stack.pop()
+            self.undo_stack.append(state)
+            return state
         return None
 
-def run(cmd: list[str]):
+class FramePrefetcher:
+    """Decodes proxy frames ahead of playback on a background thread.
+
+    HighGUI (imshow/waitKey) stays on the main thread; this thread only reads
+    from the VideoCapture, and only between start() and stop(), so the main
+    thread can decode from the same capture while paused. Frames are handed
+    over as (frame_idx, BGR ndarray) through a small bounded buffer.
+    """
+
+    def __init__(self, cap, depth: int = 8):
+        self.cap = cap
+        self.depth = depth
+        self.buffer = deque(maxlen=depth)
+        self.cond = threading.Condition()
+        self.decode_lock = threading.Lock()  # held while the thread uses cap
+        self.active = False
+        self.eof = False
+        self.next_frame = 0
+        self.step = 1
+        self.cap_pos = 0  # index the next cap.read() returns
+        self._gen = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def start(self, first_frame: int, step: int, cap_pos: int):
+        """Decode first_frame, first_frame + step, ... from a capture at cap_pos.
+
+        Only call this while stopped: once running, the thread's own cap_pos
+        is the only accurate one, and stop() returns it.
+        """
+        with self.cond:
+            self._gen += 1
+            self.buffer.clear()
+            self.next_frame, self.step, self.cap_pos = first_frame, step, cap_pos
+            self.eof = False
+            self.active = True
+            self.cond.notify_all()
+
+    def stop(self) -> int:
+        """Stop decoding ahead; returns the capture position it left behind."""
+        with self.cond:
+            self._gen += 1
+            self.active = False
+            self.buffer.clear()
+            self.cond.notify_all()
+        with self.decode_lock:
+            return self.cap_pos
+
+    def get(self, timeout: float):
+        """Next decoded (frame_idx, frame), or None if none arrived in time."""
+        with self.cond:
+            self.cond.wait_for(lambda: self.buffer or self.eof or self._closed, timeout)
+            if not self.buffer:
+                return None
+            item = self.buffer.popleft()
+            self.cond.notify_all()
+            return item
+
+    def close(self):
+        with self.cond:
+            self._closed = True
+            self.cond.notify_all()
+        self._thread.join(timeout=1.0)
+
+    def _run(self):
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self._closed or (
+                    self.active and not self.eof and len(self.buffer) < self.depth))
+                if self._closed:
+                    return
+                gen, n = self._gen, self.next_frame
+            with self.decode_lock:
+                if 0 < n - self.cap_pos <= GRAB_SKIP_MAX:
+                    # Faster than 1x: skip the frames in between without
+                    # converting them to BGR
+                    for _ in range(n - self.cap_pos):
+                        self.cap.grab()
+                elif self.cap_pos != n:
+                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, n)
+                ok, frame = self.cap.read()
+                self.cap_pos = n + 1 if ok else -1
+            with self.cond:
+                if gen != self._gen:
+                    continue  # seeked or stopped meanwhile
+                if not ok:
+                    self.eof = True
+                else:
+                    self.buffer.append((n, frame))
+                    self.next_frame = n + self.step
+                self.cond.notify_all()
+
+class StdFrameSource:
+    """Full-resolution frames from the std proxy for the precision zoom.
+
+    Used when the marking loop decodes a smaller proxy: the capture is opened
+    on first use and reads sequentially while the frame index only moves
+    forward a little, like the main loop does.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.cap = None
+        self.pos = 0  # index the next cap.read() returns
+        self.last = (-1, None)  # (frame_idx, frame) decoded most recently
+
+    def get(self, n: int):
+        """Std frame n, or None if it can't be decoded."""
+        if self.last[0] == n:
+            return self.last[1]
+        if self.cap is None:
+            self.cap = cv2.VideoCapture(str(self.path))
+        if not self.cap.isOpened():
+            return None
+        if 0 < n - self.pos <= GRAB_SKIP_MAX:
+            for _ in range(n - self.pos):
+                self.cap.grab()
+        elif n != self.pos:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, n)
+        ok, frame = self.cap.read()
+        if not ok:
+            self.pos = -1
+            return None
+        self.pos = n + 1
+        self.last = (n, frame)
+        return frame
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+
+class FfmpegPipeReader:
+    """Proxy decoder that reads raw yuv420p frames from an ffmpeg pipe.
+
+    Stands in for cv2.VideoCapture in the marking loop (--fast-decode): read()
+    converts one I420 frame to BGR with cvtColor, grab() drops a frame without
+    converting it, and seeking restarts ffmpeg with -ss before -i.
+    """
+
+    def __init__(self, path: pathlib.Path, width: int, height: int, fps: float):
+        self.path = path
+        self.width, self.height, self.fps = width, height, fps
+        self.frame_bytes = width * height * 3 // 2
+        self.proc = None
+        self.pos = 0  # index of the next frame read() returns
+
+    def isOpened(self) -> bool:
+        return self.path.exists() and self.width > 0 and self.height > 0
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.pos)
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        if prop == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        return 0.0
+
+    def set(self, prop, value) -> bool:
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return False
+        self._stop()
+        self.pos = max(0, int(value))
+        return True
+
+    def _start(self):
+        cmd = [FFMPEG_CMD, "-v", "error", "-nostdin"]
+        if self.pos > 0:
+            cmd += ["-ss", f"{self.pos / self.fps:.6f}"]
+        cmd += ["-i", str(self.path), "-an", "-f", "rawvideo", "-pix_fmt", "yuv420p", "-"]
+        self.proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                     bufsize=self.frame_bytes * 8)
+
+    def _stop(self):
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.stdout.close()
+            self.proc.wait()
+            self.proc = None
+
+    def _next(self):
+        if self.proc is None:
+            self._start()
+        buf = self.proc.stdout.read(self.frame_bytes)
+        if len(buf) < self.frame_bytes:
+            return None
+        self.pos += 1
+        return buf
+
+    def grab(self) -> bool:
+        return self._next() is not None
+
+    def read(self):
+        buf = self._next()
+        if buf is None:
+            return False, None
+        yuv = np.frombuffer(buf, np.uint8).reshape(self.height * 3 // 2, self.width)
+        return True, cv2.cvtColor(yuv, cv2.COLOR_YUV2BGR_I420)
+
+    def release(self):
+        self._stop()
+
+class CudaProxyReader:
+    """Proxy decoder on the GPU via cv2.cudacodec (NVDEC), for --gpu-decode.
+
+    Frames are decoded, converted and scaled to out_size on the GPU and only
+    the display-sized BGR result is downloaded. Exposes the parts of the
+    VideoCapture interface the marking loop and FramePrefetcher use; seeking
+    reopens the reader at the target frame.
+    """
+
+    def __init__(self, path: pathlib.Path, out_size: Tuple[int, int], fps: float):
+        self.path = path
+        self.out_size = out_size
+        self.fps = fps
+        self.pos = 0  # index of the next frame read() returns
+        self.reader = None
+        self._open(0)
+
+    def _open(self, first_frame: int):
+        self.reader = None
+        try:
+            params = cv2.cudacodec.VideoReaderInitParams()
+            params.firstFrameIdx = first_frame
+            self.reader = cv2.cudacodec.createVideoReader(str(self.path), params=params)
+            self.pos = first_frame
+        except (cv2.error, AttributeError):
+            # Older OpenCV: no firstFrameIdx, so start over and skip forward
+            try:
+                self.reader = cv2.cudacodec.createVideoReader(str(self.path))
+            except cv2.error:
+                return
+            self.pos = 0
+            while self.pos < first_frame and self.grab():
+                pass
+
+    def isOpened(self) -> bool:
+        return self.reader is not None
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.pos)
+        if prop == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        return 0.0
+
+    def set(self, prop, value) -> bool:
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return False
+        self._open(max(0, int(value)))
+        return self.reader is not None
+
+    def grab(self) -> bool:
+        if self.reader is None or not self.reader.grab():
+            return False
+        self.pos += 1
+        return True
+
+    def read(self):
+        if self.reader is None:
+            return False, None
+        ok, gpu_frame = self.reader.nextFrame()
+        if not ok:
+            return False, None
+        self.pos += 1
+        if gpu_frame.channels() == 4:
+            gpu_frame = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGRA2BGR)
+        gpu_frame = cv2.cuda.resize(gpu_frame, self.out_size, interpolation=cv2.INTER_LINEAR)
+        return True, gpu_frame.download()
+
+    def release(self):
+        self.reader = None
+
+# Seconds of encoded output between progress reports from a proxy build
+PROGRESS_EVERY = 10.0
+
+def run(cmd: list[str], progress_callback=None, label: str = ""):
+    """Run an ffmpeg command; with progress_callback, report how far it got.
+
+    ffmpeg runs as a Popen child writing -progress key=value lines to stdout
+    instead of its interactive stats line, which would garble the terminal
+    when several builds run alongside marking.
+    """
+    if progress_callback is None:
+        print("•", " ".join(cmd))
+        if subprocess.call(cmd) != 0:
+            raise RuntimeError("Command failed")
+        return
+    cmd = [cmd[0], "-hide_banner", "-loglevel", "error", "-nostats", "-progress", "pipe:1", *cmd[1:]]
     print("•", " ".join(cmd))
-    if subprocess.call(cmd) != 0:
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    next_report = PROGRESS_EVERY
+    for line in proc.stdout:
+        key, _, value = line.strip().partition("=")
+        if key == "out_time_us" and value.isdigit():  # microseconds despite the name
+            secs = int(value) / 1e6
+            if secs >= next_report:
+                progress_callback(f"{label}: {secs:.0f}s encoded")
+                next_report = secs + PROGRESS_EVERY
+        elif key == "progress" and value == "end":
+            progress_callback(f"{label}: done")
+    if proc.wait() != 0:
         raise RuntimeError("Command failed")
 
 def find_athletes() -> list[pathlib.Path]:
     if not ATHLETES.exists():
         return []
-    return sorted([p for p in ATHLETES.iterdir() if p.is_dir()])
+    # scandir's DirEntry caches the file type, so no extra stat() per entry
+    with os.scandir(ATHLETES) as it:
+        return sorted(pathlib.Path(e.path) for e in it if e.is_dir())
 
 def choose_athlete_interactive() -> pathlib.Path | None:
     options = find_athletes()
@@ -238,22 +595,49 @@ def validate_athlete_dir(base: pathlib.Path) -> dict[str, pathlib.Path]:
     return {"clips_in": clips_in, "work": work, "output": output, "prox": prox}
 
 def list_clips(clips_in: pathlib.Path) -> List[pathlib.Path]:
-    return sorted([p for p in clips_in.iterdir() if p.suffix.lower() in VIDEO_EXTS])
-
-def build_proxy(src: pathlib.Path, dst: pathlib.Path, progress_callback=None):
-    """Enhanced proxy building with progress callback"""
-    vf = f"scale={TARGET_W}:-2:flags=bicubic,fps={FPS},setsar=1"
-    cmd = [FFMPEG_CMD,"-y","-noautorotate","-i",str(src),
-           "-vf",vf,
-           "-c:v","libx264","-preset","veryfast","-crf",str(CRF),
-           "-pix_fmt","yuv420p",
-           "-an",
-           str(dst)]
+    with os.scandir(clips_in) as it:
+        return sorted(pathlib.Path(e.path) for e in it
+                      if e.is_file() and os.path.splitext(e.name)[1].lower() in VIDEO_EXTS)
+
+def display_proxy_path(proxy: pathlib.Path) -> pathlib.Path:
+    """clipNN_std.mp4 -> clipNN_disp.mp4 (the display-width marking proxy)."""
+    return proxy.with_name(proxy.stem.replace("_std", "") + "_disp" + proxy.suffix)
+
+def build_proxy(src: pathlib.Path, dst: pathlib.Path, progress_callback=None,
+                disp_dst: pathlib.Path | None = None):
+    """Enhanced proxy building with progress callback.
+
+    With disp_dst, the same ffmpeg run also writes a DISPLAY_W-wide proxy for
+    the marking window, so the source is only opened and decoded once.
+    """
+    if disp_dst is None:
+        vf = f"scale={TARGET_W}:-2:flags=bicubic,fps={FPS},setsar=1"
+        cmd = [FFMPEG_CMD,"-y","-noautorotate","-i",str(src),
+               "-vf",vf,
+               "-c:v","libx264","-preset","veryfast","-crf",str(CRF),
+               "-pix_fmt","yuv420p",
+               "-an",
+               str(dst)]
+    else:
+        # One decode and one fps pass, split into the two scaled outputs
+        fc = (f"[0:v]fps={FPS},split=2[a][b];"
+              f"[a]scale={TARGET_W}:-2:flags=bicubic,setsar=1[std];"
+              f"[b]scale={DISPLAY_W}:-2:flags=bicubic,setsar=1[disp]")
+        cmd = [FFMPEG_CMD,"-y","-noautorotate","-i",str(src),
+               "-filter_complex",fc,
+               "-map","[std]",
+               "-c:v","libx264","-preset","veryfast","-crf",str(CRF),
+               "-pix_fmt","yuv420p",
+               str(dst),
+               "-map","[disp]",
+               "-c:v","libx264","-preset","veryfast","-crf",str(DISPLAY_CRF),
+               "-pix_fmt","yuv420p",
+               str(disp_dst)]
 
     if progress_callback:
         progress_callback(f"Building proxy for {src.name}...")
 
-    run(cmd)
+    run(cmd, progress_callback, src.name)
 
 def get_meta(cap):
     fps = cap.get(cv2.CAP_PROP_FPS) or FPS
@@ -263,6 +647,16 @@ def get_meta(cap):
     dur = total_frames / fps if total_frames > 0 else 0.0
     return fps, total_frames, w, h, dur
 
+def resize_for_display(frame, size, interpolation, use_opencl: bool = False):
+    """cv2.resize, through OpenCL (T-API) when use_opencl; returns an ndarray.
+
+    Only the resize goes to the GPU: the HUD covers a small band and is
+    cheaper to draw on the CPU than to round-trip through UMat ROIs.
+    """
+    if use_opencl:
+        return cv2.resize(cv2.UMat(frame), size, interpolation=interpolation).get()
+    return cv2.resize(frame, size, interpolation=interpolation)
+
 def clamp(v, a, b):
     return max(a, min(b, v))
 
@@ -310,11 +704,31 @@ Tips:
 """
     print(help_text)
 
+# Top-left corner of the HUD text box and its line spacing, display px
+HUD_BOX_ORIGIN = (10, 5)
+HUD_LINE_H = 30
+# Black text box with the mode/hint line already drawn, keyed by
+# (width, height, line3); that line only changes when a mode is toggled
+_hud_bg_cache: Dict[Tuple[int, int, str], np.ndarray] = {}
+
+def hud_background(width: int, height: int, line3: str) -> np.ndarray:
+    """Cached HUD box bitmap (black, with line3) for draw_enhanced_hud."""
+    key = (width, height, line3)
+    bg = _hud_bg_cache.get(key)
+    if bg is None:
+        x0, y0 = HUD_BOX_ORIGIN
+        bg = np.zeros((height, width, 3), dtype=np.uint8)
+        cv2.putText(bg, line3, (20 - x0, HUD_LINE_H * 3 - y0), cv2.FONT_HERSHEY_SIMPLEX, 0.6,
+                    (200, 200, 200), 1, cv2.LINE_AA)
+        if len(_hud_bg_cache) >= 8:
+            _hud_bg_cache.clear()
+        _hud_bg_cache[key] = bg
+    return bg
+
 def draw_enhanced_hud(frame, t, fps, frame_idx, total_frames, rate, paused,
                      radius_disp, start_trim, end_trim, spot_time, spot_frame,
                      marker_disp, zoom_mode=False, help_visible=False):
     """Enhanced HUD with more information and better layout"""
-    overlay = frame.copy()
 
     # Main status line
     status = "PAUSED" if paused else "PLAYING"
@@ -338,34 +752,35 @@ def draw_enhanced_hud(frame, t, fps, frame_idx, total_frames, rate, paused,
 
     # Draw text with better visibility
     font = cv2.FONT_HERSHEY_SIMPLEX
-
-    # Black background for better readability
-    text_bg_color = (0, 0, 0, 180)
     text_color = (255, 255, 255)
 
     # Position text at top
-    y_offset = 30
-    cv2.rectangle(overlay, (10, 5), (frame.shape[1] - 10, y_offset * 3 + 15), text_bg_color[:3], -1)
-
-    cv2.putText(overlay, line1, (20, y_offset), font, 0.7, text_color, 2, cv2.LINE_AA)
-    cv2.putText(overlay, line2, (20, y_offset * 2), font, 0.7, text_color, 2, cv2.LINE_AA)
-    cv2.putText(overlay, line3, (20, y_offset * 3), font, 0.6, (200, 200, 200), 1, cv2.LINE_AA)
-
-    # Draw marker with enhanced visibility
+    y_offset = HUD_LINE_H
+
+    # Translucent HUD: blend only the text box rather than copying and
+    # blending the whole frame. The box background and the mode/hint line
+    # come from a cached bitmap; only the two changing lines are drawn.
+    x0, y0 = HUD_BOX_ORIGIN
+    hud = frame[y0:y_offset * 3 + 16, x0:frame.shape[1] - 9]
+    overlay = hud_background(hud.shape[1], hud.shape[0], line3).copy()
+    cv2.putText(overlay, line1, (20 - x0, y_offset - y0), font, 0.7, text_color, 2, cv2.LINE_AA)
+    cv2.putText(overlay, line2, (20 - x0, y_offset * 2 - y0), font, 0.7, text_color, 2, cv2.LINE_AA)
+    cv2.addWeighted(overlay, 0.9, hud, 0.1, 0, hud)
+
+    # Draw marker with enhanced visibility (opaque, straight onto the frame)
     if marker_disp:
         # Main ring
-        cv2.circle(overlay, marker_disp, radius_disp, (0, 0, 255), 3)
+        cv2.circle(frame, marker_disp, radius_disp, (0, 0, 255), 3)
         # Outer glow
-        cv2.circle(overlay, marker_disp, radius_disp + 3, (0, 0, 255), 1)
+        cv2.circle(frame, marker_disp, radius_disp + 3, (0, 0, 255), 1)
         # Center dot
-        cv2.circle(overlay, marker_disp, 3, (0, 0, 255), -1)
+        cv2.circle(frame, marker_disp, 3, (0, 0, 255), -1)
         # Crosshairs
-        cv2.line(overlay, (marker_disp[0] - 15, marker_disp[1]),
+        cv2.line(frame, (marker_disp[0] - 15, marker_disp[1]),
                 (marker_disp[0] + 15, marker_disp[1]), (0, 0, 255), 2)
-        cv2.line(overlay, (marker_disp[0], marker_disp[1] - 15),
+        cv2.line(frame, (marker_disp[0], marker_disp[1] - 15),
                 (marker_disp[0], marker_disp[1] + 15), (0, 0, 255), 2)
 
-    cv2.addWeighted(overlay, 0.9, frame, 0.1, 0, frame)
     return frame
 
 def create_player_profile_interactive(template_manager: PlayerTemplate) -> Dict[str, Any]:
@@ -415,7 +830,9 @@ def create_player_profile_interactive(template_manager: PlayerTemplate) -> Dict[
     return profile
 
 def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
-                          clip_index: int, smart_defaults: SmartDefaults):
+                          clip_index: int, smart_defaults: SmartDefaults,
+                          fast_decode: bool = False, gpu_decode: bool = False,
+                          use_opencl: bool = False):
     """Enhanced marking with better UX and smart features"""
     cap = cv2.VideoCapture(str(proxy_path))
     if not cap.isOpened():
@@ -423,17 +840,58 @@ def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
         return None
 
     fps, total_frames, w, h, dur = get_meta(cap)
+    # Key-handler constants, worked out once per clip
+    last_frame = max(0, total_frames - 1)
+    seek_small, seek_big = int(0.5 * fps), int(5 * fps)
 
     disp_max_w, disp_max_h = 1280, 720
     scale = min(disp_max_w / w, disp_max_h / h, 1.0)
     disp_w, disp_h = int(round(w * scale)), int(round(h * scale))
 
+    # Decode the display-width proxy when it matches the window size; the
+    # std proxy above only supplies the coordinate space.
+    decode_path = proxy_path
+    disp_proxy = display_proxy_path(proxy_path)
+    if scale < 1.0 and disp_proxy.exists():
+        disp_cap = cv2.VideoCapture(str(disp_proxy))
+        if (disp_cap.isOpened()
+                and int(disp_cap.get(cv2.CAP_PROP_FRAME_WIDTH)) == disp_w
+                and int(disp_cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) == disp_h):
+            cap.release()
+            cap = disp_cap
+            decode_path = disp_proxy
+        else:
+            disp_cap.release()
+
+    if gpu_decode and CUDA_DECODE_AVAILABLE:
+        gpu_cap = CudaProxyReader(decode_path, (disp_w, disp_h), fps)
+        if gpu_cap.isOpened():
+            cap.release()
+            cap = gpu_cap
+            fast_decode = False
+        else:
+            print("GPU decoder could not open the proxy; decoding on the CPU")
+    if fast_decode:
+        cap_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        cap_h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        cap.release()
+        cap = FfmpegPipeReader(decode_path, cap_w, cap_h, fps)
+
     win = f"[{clip_index}] {orig_path.name} - Enhanced Marking"
     cv2.namedWindow(win, cv2.WINDOW_NORMAL)
     cv2.resizeWindow(win, disp_w, disp_h)
 
     # Initialize state with smart defaults
     current_frame = 0
+    decoded_frame = -1  # index of the frame currently held in `frame`
+    frame = None
+    cap_pos = 0  # index the next cap.read() returns
+    frame_cache = OrderedDict()  # frame index -> decoded frame (LRU)
+    prefetcher = FramePrefetcher(cap)
+    std_source = StdFrameSource(proxy_path)  # zoom view detail when cap is smaller
+    prefetch_job = None  # (frame shown, step) the prefetcher is reading ahead from
+    next_due = 0.0  # time.monotonic() at which the next playback frame is shown
+    last_view = None  # state the window was last drawn with
     playing = True
     rate_idx = SPEED_OPTIONS.index(1.0)  # Start at normal speed
 
@@ -446,21 +904,37 @@ def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
     start_trim = 0.0
     end_trim = 0.0
     zoom_mode = False
+    zoom_origin = None  # std-coords top-left of the zoomed crop being shown
     help_visible = False
 
     # Initialize history for undo/redo
     history = MarkerHistory()
     history.add_state(marker, radius)
 
+    # Display -> std coordinate factors for the mouse handler, computed once
+    inv_scale = 1.0 / max(scale, 1e-6)
+    inv_zoom_scale = inv_scale / 2  # zoomed view is a 2x crop
+    w_minus_1, h_minus_1 = w - 1, h - 1
+
     def on_mouse(event, x, y, flags, param):
         nonlocal marker, radius
 
+        if event == cv2.EVENT_MOUSEMOVE:
+            # By far the most frequent event and nothing here uses it
+            return
+
         if event == cv2.EVENT_LBUTTONDOWN:
-            # Convert display coordinates to video coordinates
-            fx = int(round(x / max(scale, 1e-6)))
-            fy = int(round(y / max(scale, 1e-6)))
-            fx = clamp(fx, 0, w - 1)
-            fy = clamp(fy, 0, h - 1)
+            # Convert display coordinates to video coordinates (x, y >= 0,
+            # so +0.5 and int() round to nearest)
+            if zoom_origin is not None:
+                # Zoomed view shows a 2x crop starting at zoom_origin
+                fx = int(zoom_origin[0] + x * inv_zoom_scale + 0.5)
+                fy = int(zoom_origin[1] + y * inv_zoom_scale + 0.5)
+            else:
+                fx = int(x * inv_scale + 0.5)
+                fy = int(y * inv_scale + 0.5)
+            fx = min(w_minus_1, max(0, fx))
+            fy = min(h_minus_1, max(0, fy))
 
             old_marker = marker
             marker = (fx, fy)
@@ -494,64 +968,149 @@ def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
     print("Suggestion: Use zoom mode (z) for precise marking.")
 
     while True:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
-        ok, frame = cap.read()
-        if not ok:
-            current_frame = clamp(current_frame, 0, max(0, total_frames-1))
-            cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
-            ok, frame = cap.read()
-            playing = False
-            if not ok:
-                break
-
-        t = current_frame / fps if fps > 0 else 0.0
-
-        # Apply zoom if enabled
-        display_frame = frame.copy()
-        if zoom_mode and marker:
-            # Zoom to 2x around marker
-            zoom_factor = 2.0
-            crop_w, crop_h = int(w / zoom_factor), int(h / zoom_factor)
-            x1 = clamp(marker[0] - crop_w // 2, 0, w - crop_w)
-            y1 = clamp(marker[1] - crop_h // 2, 0, h - crop_h)
-            x2, y2 = x1 + crop_w, y1 + crop_h
-
-            cropped = frame[y1:y2, x1:x2]
-            display_frame = cv2.resize(cropped, (w, h))
-
-            # Adjust marker position for zoom display
-            marker_disp_adj = (
-                int((marker[0] - x1) * zoom_factor * scale),
-                int((marker[1] - y1) * zoom_factor * scale)
-            )
-        else:
-            display_frame = cv2.resize(frame, (disp_w, disp_h), interpolation=cv2.INTER_LINEAR)
-            marker_disp_adj = (int(round(marker[0] * scale)), int(round(marker[1] * scale)))
-
-        radius_disp = int(round(radius * scale))
-        if zoom_mode:
-            radius_disp = int(round(radius * scale * 2))  # Adjust for zoom
-
-        display_frame = draw_enhanced_hud(
-            display_frame, t, fps, current_frame, total_frames,
-            SPEED_OPTIONS[rate_idx], not playing,
-            radius_disp, start_trim, end_trim,
-            spot_time, spot_frame_std, marker_disp_adj,
-            zoom_mode, help_visible
-        )
-
-        cv2.imshow(win, display_frame)
+        # Stop decoding ahead as soon as playback pauses and take the
+        # capture back for stepping/seeking on this thread.
+        if not playing and prefetch_job is not None:
+            cap_pos = prefetcher.stop()
+            prefetch_job = None
 
         if playing:
+            # Frames come from the prefetch thread; restart it whenever
+            # playback starts, seeks or changes speed. While it runs, our
+            # cap_pos is stale, so stop it first and use the one it returns.
             step = max(1, int(round(SPEED_OPTIONS[rate_idx] * 1)))
-            current_frame = clamp(current_frame + step, 0, max(0, total_frames-1))
+            if prefetch_job != (current_frame, step):
+                if prefetch_job is not None:
+                    cap_pos = prefetcher.stop()
+                first = current_frame + step if decoded_frame == current_frame else current_frame
+                prefetcher.start(first, step, cap_pos)
+                prefetch_job = (current_frame, step)
+                next_due = 0.0
+            now = time.monotonic()
+            item = prefetcher.get(timeout=0.05) if now >= next_due else None
+            if item is not None:
+                current_frame, frame = item
+                decoded_frame = current_frame
+                prefetch_job = (current_frame, step)
+                # Each shown frame advances `step` frames of video. Keep to
+                # the schedule when a frame is a little late; after a restart
+                # or a long stall, schedule from now instead.
+                frame_period = step / ((fps or FPS) * SPEED_OPTIONS[rate_idx])
+                next_due = (next_due if next_due > now - frame_period else now) + frame_period
+                frame_cache[current_frame] = frame
+                if len(frame_cache) > FRAME_CACHE_SIZE:
+                    frame_cache.popitem(last=False)
+            elif prefetcher.eof and now >= next_due:
+                playing = False
+        elif current_frame != decoded_frame and current_frame in frame_cache:
+            frame = frame_cache[current_frame]
+            frame_cache.move_to_end(current_frame)
+            decoded_frame = current_frame
+        # Only decode when the frame changes, and only seek on real jumps:
+        # CAP_PROP_POS_FRAMES re-seeks to the previous keyframe and decodes
+        # forward, so sequential stepping just keeps reading.
+        elif current_frame != decoded_frame:
+            if 0 < current_frame - cap_pos <= GRAB_SKIP_MAX:
+                for _ in range(current_frame - cap_pos):
+                    cap.grab()
+            elif current_frame != cap_pos:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
+            ok, raw = cap.read()
+            if not ok:
+                # Past the real end (the frame count can overshoot by a frame
+                # or two): stay on the last frame shown and don't retry
+                # until the user moves somewhere else.
+                playing = False
+                cap_pos = -1
+                if frame is None:
+                    break
+                current_frame = decoded_frame
+            else:
+                frame = raw
+                decoded_frame = current_frame
+                cap_pos = current_frame + 1
+                frame_cache[current_frame] = frame
+                if len(frame_cache) > FRAME_CACHE_SIZE:
+                    frame_cache.popitem(last=False)
+
+        if frame is None:
+            # Playback just started and the first frame isn't decoded yet
+            if (cv2.waitKey(1) & 0xFF) in (ord('q'), 27):
+                prefetcher.close()
+                std_source.release()
+                cap.release()
+                cv2.destroyWindow(win)
+                return None
+            continue
 
-        key = cv2.waitKey(1 if playing else 20) & 0xFF
+        # Only recomposite when something visible changed (a new frame during
+        # playback, or a key/mouse edit while paused); otherwise the window
+        # already shows this state and the loop just polls for input.
+        view = (current_frame, marker, radius, zoom_mode, help_visible, rate_idx,
+                playing, start_trim, end_trim, spot_time)
+        if view != last_view:
+            t = current_frame / fps if fps > 0 else 0.0
+
+            # Apply zoom if enabled
+            if zoom_mode and marker:
+                # Zoom to 2x around marker
+                zoom_factor = 2.0
+                crop_w, crop_h = int(w / zoom_factor), int(h / zoom_factor)
+                x1 = clamp(marker[0] - crop_w // 2, 0, w - crop_w)
+                y1 = clamp(marker[1] - crop_h // 2, 0, h - crop_h)
+                x2, y2 = x1 + crop_w, y1 + crop_h
+
+                zoom_src = frame
+                if frame.shape[1] != w:
+                    # Crop from the full-resolution std frame, not the
+                    # display-sized one, so the zoom keeps its detail
+                    zoom_src = std_source.get(current_frame)
+                    if zoom_src is None:
+                        zoom_src = frame
+                fs = zoom_src.shape[1] / w  # 1.0 for std frames
+                cropped = zoom_src[int(y1 * fs):int(y2 * fs), int(x1 * fs):int(x2 * fs)]
+                # One resize, straight to the window size; nearest-neighbour
+                # keeps the pixel grid visible for precise marking
+                display_frame = resize_for_display(cropped, (disp_w, disp_h), cv2.INTER_NEAREST, use_opencl)
+                zoom_origin = (x1, y1)
+
+                # Adjust marker position for zoom display
+                marker_disp_adj = (
+                    int((marker[0] - x1) * zoom_factor * scale),
+                    int((marker[1] - y1) * zoom_factor * scale)
+                )
+            else:
+                if frame.shape[1] == disp_w and frame.shape[0] == disp_h:
+                    display_frame = frame.copy()  # display proxy; keep the cached frame clean
+                else:
+                    display_frame = resize_for_display(frame, (disp_w, disp_h), cv2.INTER_LINEAR, use_opencl)
+                marker_disp_adj = (int(round(marker[0] * scale)), int(round(marker[1] * scale)))
+                zoom_origin = None
+
+            radius_disp = int(round(radius * scale))
+            if zoom_mode:
+                radius_disp = int(round(radius * scale * 2))  # Adjust for zoom
+
+            display_frame = draw_enhanced_hud(
+                display_frame, t, fps, current_frame, total_frames,
+                SPEED_OPTIONS[rate_idx], not playing,
+                radius_disp, start_trim, end_trim,
+                spot_time, spot_frame_std, marker_disp_adj,
+                zoom_mode, help_visible
+            )
+
+            cv2.imshow(win, display_frame)
+            last_view = view
+
+        # During playback, wait for input until the next frame is due
+        key = cv2.waitKey(max(1, int((next_due - time.monotonic()) * 1000)) if playing else 20) & 0xFF
         if key == 255:
             continue
 
         # Handle enhanced key commands
         if key in (ord('q'), 27):  # q or Esc
+            prefetcher.close()
+            std_source.release()
             cap.release()
             cv2.destroyWindow(win)
             return None
@@ -560,22 +1119,22 @@ def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
             playing = not playing
 
         elif key == ord(',') and not playing:  # Previous frame
-            current_frame = clamp(current_frame - 1, 0, max(0, total_frames-1))
+            current_frame = max(0, min(last_frame, current_frame - 1))
 
         elif key == ord('.') and not playing:  # Next frame
-            current_frame = clamp(current_frame + 1, 0, max(0, total_frames-1))
+            current_frame = max(0, min(last_frame, current_frame + 1))
 
         elif key == 81:   # Left arrow
-            current_frame = clamp(current_frame - int(0.5 * fps), 0, max(0, total_frames-1))
+            current_frame = max(0, min(last_frame, current_frame - seek_small))
 
         elif key == 83:   # Right arrow
-            current_frame = clamp(current_frame + int(0.5 * fps), 0, max(0, total_frames-1))
+            current_frame = max(0, min(last_frame, current_frame + seek_small))
 
         elif key == 82:   # Up arrow
-            current_frame = clamp(current_frame - int(5 * fps), 0, max(0, total_frames-1))
+            current_frame = max(0, min(last_frame, current_frame - seek_big))
 
         elif key == 84:   # Down arrow
-            current_frame = clamp(current_frame + int(5 * fps), 0, max(0, total_frames-1))
+            current_frame = max(0, min(last_frame, current_frame + seek_big))
 
         elif key == ord('['):  # Decrease speed
             rate_idx = max(0, rate_idx - 1)
@@ -586,7 +1145,7 @@ def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
         elif key == ord('g'):  # Go to time
             try:
                 secs = float(input("Go to time (seconds): ").strip())
-                current_frame = clamp(int(round(secs * fps)), 0, max(0, total_frames-1))
+                current_frame = max(0, min(last_frame, int(round(secs * fps))))
             except (ValueError, EOFError):
                 pass
 
@@ -612,9 +1171,8 @@ def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
             radius = clamp(radius - 6, RADIUS_MIN, RADIUS_MAX)
             history.add_state(marker, radius)
 
-        elif key in (ord('1'), ord('2'), ord('3'), ord('4'), ord('5')):  # Presets
-            presets = {ord('1'):40, ord('2'):60, ord('3'):72, ord('4'):90, ord('5'):120}
-            radius = presets[key]
+        elif key in RADIUS_PRESETS:  # Presets
+            radius = RADIUS_PRESETS[key]
             history.add_state(marker, radius)
             print(f"Radius preset: {radius}px")
 
@@ -664,6 +1222,8 @@ def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
                 spot_time = current_frame / fps if fps > 0 else 0.0
                 print(f"Auto-set spot time: {spot_time:.3f}s (frame {spot_frame_std})")
 
+            prefetcher.close()
+            std_source.release()
             cap.release()
             cv2.destroyWindow(win)
 
@@ -684,13 +1244,36 @@ def mark_on_proxy_enhanced(orig_path: pathlib.Path, proxy_path: pathlib.Path,
 
             return result
 
+    # Proxy could not be decoded at all
+    prefetcher.close()
+    std_source.release()
+    cap.release()
+    cv2.destroyWindow(win)
+    return None
+
 def main():
     ap = argparse.ArgumentParser(description="Enhanced play marking with smart features")
     ap.add_argument("--athlete", type=str, help="Athlete folder name under ./athletes")
     ap.add_argument("--dir", type=str, help="Full path to athlete folder")
     ap.add_argument("--template", type=str, help="Player template to use")
+    ap.add_argument("--fast-decode", action="store_true",
+                    help="Decode proxies through an ffmpeg raw-YUV pipe instead of OpenCV")
+    ap.add_argument("--gpu-decode", action="store_true",
+                    help="Decode proxies on an NVIDIA GPU (needs OpenCV built with CUDA/cudacodec)")
+    ap.add_argument("--opencl", action="store_true",
+                    help="Scale frames for display with OpenCL (GPU) when available")
     args = ap.parse_args()
 
+    if args.gpu_decode and not CUDA_DECODE_AVAILABLE:
+        print("GPU decoding needs OpenCV with CUDA (cv2.cudacodec); using CPU decoding.")
+
+    use_opencl = False
+    if args.opencl:
+        use_opencl = cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(use_opencl)
+        if not use_opencl:
+            print("OpenCL not available; scaling frames on the CPU")
+
     # Initialize enhancement systems
     template_manager = PlayerTemplate()
     smart_defaults = SmartDefaults()
@@ -719,7 +1302,7 @@ def main():
     existing_project = None
 
     if project_path.exists():
-        existing_project = json.loads(project_path.read_text())
+        existing_project = jsonio.loads(project_path.read_bytes())
         print(f"Found existing project for {base.name}")
 
         # Load smart defaults from existing clips
@@ -782,29 +1365,47 @@ def main():
             "clips": existing_project.get("clips", []) if existing_project else []
         }
 
-    # Process clips with enhanced marking
-    for idx, src in enumerate(clips_to_process, len(project["clips"]) + 1):
-        proxy = paths["prox"] / f"clip{idx:02d}_std.mp4"
+    # Process clips with enhanced marking. All proxy builds are queued up
+    # front and run a few at a time (libx264 already uses ~2 cores each), so
+    # later clips encode while earlier ones are being marked.
+    first_idx = len(project["clips"]) + 1
+    proxies = {idx: paths["prox"] / f"clip{idx:02d}_std.mp4"
+               for idx in range(first_idx, first_idx + len(clips_to_process))}
+    max_workers = max(1, min(4, (os.cpu_count() or 2) // 2, len(clips_to_process)))
 
-        print(f"\n=== Processing clip {idx}/{len(clips_to_process)} ===")
+    marked = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        builds = {idx: ex.submit(build_proxy, src, proxies[idx], lambda msg: print(f"  {msg}"),
+                                 display_proxy_path(proxies[idx]))
+                  for idx, src in enumerate(clips_to_process, first_idx)}
 
-        try:
-            build_proxy(src, proxy, lambda msg: print(f"  {msg}"))
-        except Exception as e:
-            print(f"Proxy build failed for {src.name}: {e}")
-            continue
+        for idx, src in enumerate(clips_to_process, first_idx):
+            proxy = proxies[idx]
 
-        data = mark_on_proxy_enhanced(src, proxy, idx, smart_defaults)
-        if data is not None:
-            project["clips"].append(data)
-            # Auto-save progress
-            project_path.write_text(json.dumps(project, indent=2))
-            print(f"  ✓ Saved progress to {project_path}")
-        else:
-            print(f"Skipped: {src.name}")
+            print(f"\n=== Processing clip {idx}/{len(clips_to_process)} ===")
+
+            try:
+                builds[idx].result()
+            except Exception as e:
+                print(f"Proxy build failed for {src.name}: {e}")
+                continue
+
+            data = mark_on_proxy_enhanced(src, proxy, idx, smart_defaults,
+                                          fast_decode=args.fast_decode,
+                                          gpu_decode=args.gpu_decode,
+                                          use_opencl=use_opencl)
+            if data is not None:
+                project["clips"].append(data)
+                marked += 1
+                # Checkpoint every few clips; the full save happens at the end
+                if marked % AUTOSAVE_EVERY == 0:
+                    atomic_write_json(project_path, project)
+                    print(f"  ✓ Saved progress to {project_path}")
+            else:
+                print(f"Skipped: {src.name}")
 
     # Final save
-    project_path.write_text(json.dumps(project, indent=2))
+    atomic_write_json(project_path, project)
     print(f"\n✅ Enhanced marking completed!")
     print(f"📁 Project saved: {project_path}")
     print(f"🎬 Next step: python render_highlight.py --dir \"{base}\"")
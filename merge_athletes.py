@@ -22,18 +22,45 @@ The merge process:
 
 import argparse
 import json
+import os
 import pathlib
 import sys
-from typing import Dict, List, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional
 
+from utils import jsonio
 from utils.structure import (
-    is_v2_structure,
     create_v2_structure,
     get_athlete_profile,
+    is_v2_structure_cached,
     SCHEMA_VERSION,
 )
+from migrate_athlete import migrate_athlete
 
 ROOT = pathlib.Path.cwd() / "athletes"
+# String form for the os.scandir / os.path calls in the folder scans
+ROOT_STR = str(ROOT)
+
+# v2 classification is a handful of stats per folder; on network shares the
+# round-trips dominate, so classify folders concurrently
+CLASSIFY_WORKERS = 16
+
+# Player profile fields, in athlete.json order
+PROFILE_FIELDS = (
+    "name", "title", "position", "grad_year", "club_team",
+    "high_school", "height_weight", "gpa", "email", "phone"
+)
+
+
+@dataclass(slots=True)
+class FolderInfo:
+    """A matched folder, classified and read once per merge."""
+    path: pathlib.Path
+    is_v2: bool
+    project_name: str
+    player_profile: Optional[Dict[str, Any]] = None
 
 
 def find_matching_folders(athlete_name: str) -> List[pathlib.Path]:
@@ -44,27 +71,22 @@ def find_matching_folders(athlete_name: str) -> List[pathlib.Path]:
     - Exact name: "Phia Hull"
     - With project suffix: "Phia Hull - *"
     """
-    if not ROOT.exists():
+    if not os.path.isdir(ROOT_STR):
         return []
 
     matches = []
     name_lower = athlete_name.lower().strip()
+    prefix = name_lower + " - "
 
-    for folder in ROOT.iterdir():
-        if not folder.is_dir():
-            continue
-
-        folder_name_lower = folder.name.lower()
-
-        # Exact match
-        if folder_name_lower == name_lower:
-            matches.append(folder)
-            continue
+    with os.scandir(ROOT_STR) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
 
-        # Pattern match: "Athlete Name - *"
-        if folder_name_lower.startswith(f"{name_lower} - "):
-            matches.append(folder)
-            continue
+            # Exact match or pattern match: "Athlete Name - *"
+            folder_name_lower = entry.name.lower()
+            if folder_name_lower == name_lower or folder_name_lower.startswith(prefix):
+                matches.append(pathlib.Path(entry.path))
 
     return sorted(matches)
 
@@ -76,33 +98,45 @@ def find_all_merge_candidates() -> Dict[str, List[pathlib.Path]]:
     Returns:
         Dictionary mapping athlete names to their matching folders
     """
-    if not ROOT.exists():
+    if not os.path.isdir(ROOT_STR):
         return {}
 
-    # Group folders by base athlete name
-    groups: Dict[str, List[pathlib.Path]] = {}
+    with os.scandir(ROOT_STR) as it:
+        entries = [e for e in it if e.is_dir()]
+
+    with ThreadPoolExecutor(max_workers=min(CLASSIFY_WORKERS, len(entries) or 1)) as pool:
+        v2_flags = list(pool.map(is_v2_structure_cached, (e.path for e in entries)))
 
-    for folder in ROOT.iterdir():
-        if not folder.is_dir():
-            continue
+    # Base athlete name (before " - ") of every legacy folder
+    legacy = [
+        (entry, entry.name.partition(" - ")[0].strip())
+        for entry, is_v2 in zip(entries, v2_flags)
+        if not is_v2
+    ]
 
-        # Skip v2 folders
-        if is_v2_structure(folder):
-            continue
+    # Most athletes have a single folder; count first so only names that
+    # repeat get a list of paths
+    counts = Counter(base_name for _entry, base_name in legacy)
 
-        name = folder.name
-        # Extract base name (before " - ")
-        if " - " in name:
-            base_name = name.split(" - ", 1)[0].strip()
-        else:
-            base_name = name.strip()
+    groups: Dict[str, List[pathlib.Path]] = {}
+    for entry, base_name in legacy:
+        if counts[base_name] > 1:
+            groups.setdefault(base_name, []).append(pathlib.Path(entry.path))
 
-        if base_name not in groups:
-            groups[base_name] = []
-        groups[base_name].append(folder)
+    return groups
 
-    # Filter to only those with multiple folders
-    return {k: v for k, v in groups.items() if len(v) > 1}
+
+def _merge_two_profiles(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str, Any]:
+    """merge_profiles() for exactly two profiles, the existing-athlete update case."""
+    merged = {}
+    for field in PROFILE_FIELDS:
+        value = first.get(field, "")
+        if not (value and str(value).strip()):
+            value = second.get(field, "")
+            if not (value and str(value).strip()):
+                value = ""
+        merged[field] = value
+    return merged
 
 
 def merge_profiles(profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -115,22 +149,25 @@ def merge_profiles(profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Merged profile with most complete data
     """
-    merged = {}
-
-    fields = [
-        "name", "title", "position", "grad_year", "club_team",
-        "high_school", "height_weight", "gpa", "email", "phone"
-    ]
-
-    for field in fields:
-        # Find first non-empty value
-        for profile in profiles:
+    if len(profiles) == 2:
+        return _merge_two_profiles(profiles[0], profiles[1])
+
+    merged = dict.fromkeys(PROFILE_FIELDS, "")
+
+    # One pass per profile, only looking at fields still empty; usually the
+    # first profile fills everything and the loop ends there
+    missing = list(PROFILE_FIELDS)
+    for profile in profiles:
+        if not missing:
+            break
+        still_missing = []
+        for field in missing:
             value = profile.get(field, "")
             if value and str(value).strip():
                 merged[field] = value
-                break
-        if field not in merged:
-            merged[field] = ""
+            else:
+                still_missing.append(field)
+        missing = still_missing
 
     return merged
 
@@ -143,17 +180,46 @@ def extract_project_name(folder_name: str, athlete_name: str) -> str:
     - "Phia Hull - Dec Highlight" with athlete "Phia Hull" → "Dec Highlight"
     - "Phia Hull" with athlete "Phia Hull" → "Default"
     """
-    name_lower = athlete_name.lower()
-    folder_lower = folder_name.lower()
-
-    if folder_lower.startswith(f"{name_lower} - "):
+    prefix_len = len(athlete_name) + 3
+    if folder_name[:prefix_len].lower() == athlete_name.lower() + " - ":
         # Has project suffix
-        return folder_name[len(athlete_name) + 3:].strip()
+        return folder_name[prefix_len:].strip()
 
     # Same as athlete name
     return "Default"
 
 
+def scan_folders(folders: List[pathlib.Path], athlete_name: str) -> List[FolderInfo]:
+    """
+    Classify each folder and load its player profile in a single pass.
+
+    The profile, planning and execute steps of merge_athletes all work from
+    this list instead of re-checking the structure and re-reading JSON.
+    """
+    infos = []
+    for folder in folders:
+        is_v2 = is_v2_structure_cached(str(folder))
+        profile = None
+        if is_v2:
+            profile = get_athlete_profile(folder)
+        else:
+            try:
+                raw = (folder / "project.json").read_bytes()
+                # Older projects carry no player block; only the profile is
+                # wanted here, so don't parse clip lists that can't have one
+                if b'"player"' in raw:
+                    profile = jsonio.loads(raw).get("player")
+            except (FileNotFoundError, json.JSONDecodeError):
+                pass
+        infos.append(FolderInfo(
+            path=folder,
+            is_v2=is_v2,
+            project_name=extract_project_name(folder.name, athlete_name),
+            player_profile=profile,
+        ))
+    return infos
+
+
 def merge_athletes(
     athlete_name: str,
     dry_run: bool = False,
@@ -185,7 +251,9 @@ def merge_athletes(
         result["actions"].append(f"ERROR: No folders found matching '{athlete_name}'")
         return result
 
-    if len(folders) == 1 and not is_v2_structure(folders[0]):
+    infos = scan_folders(folders, athlete_name)
+
+    if len(infos) == 1 and not infos[0].is_v2:
         result["actions"].append(f"NOTE: Only one folder found. Use migrate_athlete.py instead.")
         return result
 
@@ -193,22 +261,10 @@ def merge_athletes(
     athlete_dir = ROOT / athlete_name
 
     # Check if athlete already exists as v2
-    existing_v2 = athlete_dir.exists() and is_v2_structure(athlete_dir)
+    existing_v2 = athlete_dir.exists() and is_v2_structure_cached(str(athlete_dir))
 
     # Collect player profiles from all folders
-    profiles = []
-    for folder in folders:
-        if is_v2_structure(folder):
-            profiles.append(get_athlete_profile(folder))
-        else:
-            project_json = folder / "project.json"
-            if project_json.exists():
-                try:
-                    data = json.loads(project_json.read_text())
-                    if "player" in data:
-                        profiles.append(data["player"])
-                except json.JSONDecodeError:
-                    pass
+    profiles = [info.player_profile for info in infos if info.player_profile is not None]
 
     # Merge profiles
     merged_profile = merge_profiles(profiles)
@@ -220,15 +276,16 @@ def merge_athletes(
         result["actions"].append(f"CREATE: athlete.json with merged player profile")
 
     # Plan folder migrations
-    for folder in folders:
-        if is_v2_structure(folder):
+    for info in infos:
+        folder = info.path
+        if info.is_v2:
             if folder == athlete_dir:
                 result["actions"].append(f"SKIP: Already target v2 folder: {folder}")
             else:
                 # Merge projects from another v2 folder
                 result["actions"].append(f"MERGE: projects from {folder}")
         else:
-            project_name = extract_project_name(folder.name, athlete_name)
+            project_name = info.project_name
             project_dir = athlete_dir / "projects" / project_name
 
             if project_dir.exists() and not force:
@@ -248,28 +305,35 @@ def merge_athletes(
         if not existing_v2:
             athlete_dir.mkdir(parents=True, exist_ok=True)
             create_v2_structure(athlete_dir, merged_profile)
+            is_v2_structure_cached.cache_clear()
         else:
             # Update profile if we have better data
             athlete_json = athlete_dir / "athlete.json"
-            if athlete_json.exists():
-                existing = json.loads(athlete_json.read_text())
+            # The target folder is usually one of the scanned v2 folders,
+            # whose athlete.json scan_folders already parsed
+            parsed_profiles = {
+                info.path: info.player_profile
+                for info in infos if info.is_v2 and info.player_profile
+            }
+            existing = parsed_profiles.get(athlete_dir)
+            if existing is None and athlete_json.exists():
+                existing = jsonio.loads(athlete_json.read_bytes())
+            if existing is not None:
                 updated = merge_profiles([existing, merged_profile])
                 updated["schema_version"] = SCHEMA_VERSION
-                athlete_json.write_text(json.dumps(updated, indent=2))
+                athlete_json.write_bytes(jsonio.dumps(updated))
 
         # Migrate each folder
-        from migrate_athlete import migrate_athlete
-
-        for folder in folders:
-            if is_v2_structure(folder):
+        for info in infos:
+            folder = info.path
+            # The target folder is v2 by now even if it was scanned as v1
+            if info.is_v2 or folder == athlete_dir:
                 if folder != athlete_dir:
                     # TODO: Merge projects from another v2 folder
                     result["actions"].append(f"NOTE: Merging v2 folders not yet implemented")
                 continue
 
             # Run migration
-            project_name = extract_project_name(folder.name, athlete_name)
-
             # Temporarily rename folder to match expected pattern
             # The migrate_athlete function expects "Athlete - Project" format
 
@@ -290,6 +354,15 @@ def merge_athletes(
     return result
 
 
+# Console prefix for each action type; anything else is a planned/done step
+ACTION_PREFIXES = {
+    "ERROR": "  ❌ ",
+    "SKIP": "  ⏭️ ",
+    "NOTE": "  ℹ️ ",
+    "WARNING": "  ⚠️ ",
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Merge multiple legacy folders into a single multi-project athlete",
@@ -344,19 +417,14 @@ Examples:
     print(f"Merging folders for: {args.athlete}")
     print(f"{'='*60}")
 
-    for action in result["actions"]:
-        prefix = "  "
-        if action.startswith("ERROR"):
-            prefix = "  ❌ "
-        elif action.startswith("SKIP"):
-            prefix = "  ⏭️ "
-        elif action.startswith("NOTE"):
-            prefix = "  ℹ️ "
-        elif action.startswith("WARNING"):
-            prefix = "  ⚠️ "
-        else:
-            prefix = "  ✓ " if not args.dry_run else "  → "
-        print(f"{prefix}{action}")
+    default_prefix = "  ✓ " if not args.dry_run else "  → "
+    lines = [
+        next((p for k, p in ACTION_PREFIXES.items() if action.startswith(k)), default_prefix)
+        + action
+        for action in result["actions"]
+    ]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     if result["success"]:
         print(f"\n✓ Merge successful")
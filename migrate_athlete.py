@@ -22,20 +22,39 @@ The migration:
 """
 
 import argparse
+import errno
 import json
+import os
 import pathlib
 import re
 import shutil
 import sys
-from typing import Tuple, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Optional, List, Union
 
+from utils import jsonio
 from utils.structure import (
-    is_v2_structure,
+    is_v2_structure_cached,
     create_v2_structure,
     SCHEMA_VERSION,
 )
 
 ROOT = pathlib.Path.cwd() / "athletes"
+# String form for the os.scandir / os.path calls in the folder scans
+ROOT_STR = str(ROOT)
+
+PathLike = Union[str, os.PathLike]
+
+# Cross-device moves of trees with more files than this are copied on a
+# thread pool when --fast-copy is given; smaller trees use shutil.move
+FAST_COPY_MIN_FILES = 100
+FAST_COPY_WORKERS = 8
+
+# Upper bound on athletes migrated at once by migrate_all()
+MIGRATE_WORKERS = 8
+
+# Path separators anywhere, or a leading dot (covers "." and "..")
+_INVALID_NAME_RE = re.compile(r"[/\\]|^\.")
 
 
 def parse_legacy_name(folder_name: str) -> Tuple[str, str]:
@@ -52,40 +71,127 @@ def parse_legacy_name(folder_name: str) -> Tuple[str, str]:
     Raises:
         ValueError: If names contain path traversal characters
     """
-    # Try to split on " - " (with spaces around hyphen)
-    if " - " in folder_name:
-        parts = folder_name.split(" - ", 1)
-        athlete_name, project_name = parts[0].strip(), parts[1].strip()
-    else:
-        # No separator found, use folder name as athlete and default project
-        athlete_name, project_name = folder_name.strip(), "Default"
+    # Split on the first " - " (with spaces around hyphen); with no separator
+    # the whole folder name is the athlete and the project is "Default"
+    head, sep, tail = folder_name.partition(" - ")
+    athlete_name = head.strip()
+    project_name = tail.strip() if sep else "Default"
 
     # Validate no path traversal characters
-    for name, label in [(athlete_name, "Athlete"), (project_name, "Project")]:
-        if "/" in name or "\\" in name or name.startswith(".") or name in (".", ".."):
+    for name, label in ((athlete_name, "Athlete"), (project_name, "Project")):
+        if _INVALID_NAME_RE.search(name):
             raise ValueError(f"{label} name contains invalid characters: {name}")
 
     return athlete_name, project_name
 
 
 def _atomic_write_json(path: pathlib.Path, data: dict) -> None:
-    """Write JSON atomically using temp file + rename pattern."""
-    tmp = path.with_suffix('.tmp')
-    tmp.write_text(json.dumps(data, indent=2))
-    tmp.rename(path)
+    """Write JSON atomically using temp file + os.replace pattern."""
+    # Append rather than with_suffix() so "x.json" and "x" never share a temp
+    # name, and os.replace so an existing target is overwritten on Windows too
+    target = os.fspath(path)
+    tmp_path = target + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(jsonio.dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, target)
+
+
+def _parallel_copytree(src: pathlib.Path, dst: pathlib.Path) -> int:
+    """
+    Copy a directory tree with several files in flight at once.
+
+    shutil.copy2 already uses the kernel's zero-copy path (sendfile /
+    copy_file_range) per file, but copies one file at a time; for clip
+    folders with many medium-sized files the devices sit idle between
+    files. Returns the number of files copied.
+    """
+    jobs = []
+    for dirpath, dirnames, filenames in os.walk(src):
+        rel = os.path.relpath(dirpath, src)
+        target_dir = os.path.join(dst, rel) if rel != "." else os.fspath(dst)
+        os.makedirs(target_dir, exist_ok=True)
+        # os.walk doesn't descend into symlinked dirs; copy them as links
+        links = [d for d in dirnames if os.path.islink(os.path.join(dirpath, d))]
+        for name in filenames + links:
+            jobs.append((os.path.join(dirpath, name), os.path.join(target_dir, name)))
+
+    def copy_one(job):
+        shutil.copy2(job[0], job[1], follow_symlinks=False)
+
+    with ThreadPoolExecutor(max_workers=FAST_COPY_WORKERS) as pool:
+        # list() re-raises the first copy error
+        list(pool.map(copy_one, jobs))
+    shutil.copystat(src, dst)
+    return len(jobs)
+
+
+def _count_files(path: pathlib.Path, limit: int) -> int:
+    """Count files under path, stopping once limit is passed."""
+    count = 0
+    for _dirpath, _dirnames, filenames in os.walk(path):
+        count += len(filenames)
+        if count > limit:
+            break
+    return count
+
+
+def _fast_move(src: PathLike, dst: PathLike, fast_copy: bool = False) -> None:
+    """
+    Move src to a non-existent dst, renaming in place when possible.
+
+    Source and target normally sit under the same athletes/ root, where a
+    plain rename is all shutil.move would end up doing anyway. Only a
+    cross-device move (EXDEV) has to copy; with fast_copy, large directory
+    trees are copied in parallel before the source is removed.
+    """
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        if (fast_copy and os.path.isdir(src)
+                and _count_files(src, FAST_COPY_MIN_FILES) > FAST_COPY_MIN_FILES):
+            try:
+                _parallel_copytree(src, dst)
+            except BaseException:
+                shutil.rmtree(dst, ignore_errors=True)
+                raise
+            shutil.rmtree(src)
+        else:
+            shutil.move(str(src), str(dst))
+
+
+def _child_names(path: pathlib.Path) -> Optional[set]:
+    """Names directly inside a directory from one scandir, or None if it's missing."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def find_legacy_folders() -> List[pathlib.Path]:
     """Find all v1 (legacy) athlete folders."""
-    if not ROOT.exists():
+    if not os.path.isdir(ROOT_STR):
         return []
 
     legacy = []
-    for p in ROOT.iterdir():
-        if p.is_dir() and not is_v2_structure(p):
+    with os.scandir(ROOT_STR) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            if is_v2_structure_cached(entry.path):
+                continue
+            try:
+                with os.scandir(entry.path) as sub:
+                    children = {child.name for child in sub}
+            except OSError:
+                continue
             # Check if it has the v1 structure markers
-            if (p / "clips_in").exists() or (p / "project.json").exists():
-                legacy.append(p)
+            if "clips_in" in children or "project.json" in children:
+                legacy.append(pathlib.Path(entry.path))
 
     return sorted(legacy)
 
@@ -93,7 +199,8 @@ def find_legacy_folders() -> List[pathlib.Path]:
 def migrate_athlete(
     source_dir: pathlib.Path,
     dry_run: bool = False,
-    force: bool = False
+    force: bool = False,
+    fast_copy: bool = False
 ) -> dict:
     """
     Migrate a legacy athlete folder to v2 structure.
@@ -102,6 +209,7 @@ def migrate_athlete(
         source_dir: Path to the legacy athlete folder
         dry_run: If True, only show what would be done
         force: If True, overwrite existing target
+        fast_copy: If True, copy large trees in parallel on cross-device moves
 
     Returns:
         Dictionary with migration results:
@@ -125,11 +233,14 @@ def migrate_athlete(
 
     source_dir = source_dir.resolve()
 
-    if not source_dir.exists():
+    # One listing of the source and target folders answers the existence
+    # checks below for planning
+    source_names = _child_names(source_dir)
+    if source_names is None:
         result["actions"].append(f"ERROR: Source folder not found: {source_dir}")
         return result
 
-    if is_v2_structure(source_dir):
+    if is_v2_structure_cached(str(source_dir)):
         result["actions"].append(f"SKIP: Already v2 structure: {source_dir}")
         return result
 
@@ -159,9 +270,9 @@ def migrate_athlete(
     player_data = {}
     project_data = {}
 
-    if project_json_path.exists():
+    if "project.json" in source_names:
         try:
-            project_data = json.loads(project_json_path.read_text())
+            project_data = jsonio.loads(project_json_path.read_bytes())
             player_data = project_data.pop("player", {})
         except json.JSONDecodeError as e:
             result["actions"].append(f"ERROR: Invalid project.json: {e}")
@@ -173,11 +284,15 @@ def migrate_athlete(
 
     # Plan the migration
     actions = []
+    athlete_names = _child_names(athlete_dir)
+    athlete_dir_exists = athlete_names is not None
+    if not athlete_dir_exists:
+        athlete_names = set()
 
-    if not athlete_dir.exists() or not is_same_location:
+    if not athlete_dir_exists or not is_same_location:
         actions.append(f"CREATE: Athlete directory: {athlete_dir}")
 
-    if not (athlete_dir / "athlete.json").exists():
+    if "athlete.json" not in athlete_names:
         actions.append(f"CREATE: athlete.json with player profile")
 
     if not is_same_location:
@@ -187,8 +302,8 @@ def migrate_athlete(
         actions.append(f"MOVE: work/ → {project_dir}/work/")
         actions.append(f"MOVE: output/ → {project_dir}/output/")
 
-        if (source_dir / "intro").exists():
-            if (athlete_dir / "intro").exists():
+        if "intro" in source_names:
+            if "intro" in athlete_names:
                 actions.append(f"MERGE: intro/ files to {athlete_dir}/intro/")
             else:
                 actions.append(f"MOVE: intro/ → {athlete_dir}/intro/")
@@ -234,21 +349,25 @@ def migrate_athlete(
             if src.exists():
                 if dst.exists():
                     shutil.rmtree(dst)
-                shutil.move(str(src), str(dst))
+                _fast_move(src, dst, fast_copy)
 
         # Handle intro folder
         src_intro = source_dir / "intro"
         dst_intro = athlete_dir / "intro"
-        if src_intro.exists():
-            if dst_intro.exists():
-                # Merge files
-                for f in src_intro.iterdir():
-                    target = dst_intro / f.name
-                    if not target.exists():
-                        shutil.move(str(f), str(target))
+        # In-place conversion: intro/ is already at the athlete level
+        if src_intro.exists() and not is_same_location:
+            existing_intro = _child_names(dst_intro)
+            if existing_intro is not None:
+                # Merge files: one listing of each side instead of a stat
+                # per file; files already in the athlete's intro/ win
+                dst_intro_str = str(dst_intro)
+                with os.scandir(src_intro) as it:
+                    for entry in it:
+                        if entry.name not in existing_intro:
+                            _fast_move(entry.path, os.path.join(dst_intro_str, entry.name))
                 shutil.rmtree(src_intro)
             else:
-                shutil.move(str(src_intro), str(dst_intro))
+                _fast_move(src_intro, dst_intro, fast_copy)
 
         # Update project.json
         project_data["schema_version"] = SCHEMA_VERSION
@@ -278,10 +397,60 @@ def migrate_athlete(
     except Exception as e:
         result["actions"].append(f"ERROR: Migration failed: {e}")
         result["success"] = False
+    finally:
+        # Folders were moved or converted, drop stale classifications
+        is_v2_structure_cached.cache_clear()
 
     return result
 
 
+def migrate_all(
+    folders: List[pathlib.Path],
+    dry_run: bool = False,
+    force: bool = False,
+    fast_copy: bool = False
+) -> List[dict]:
+    """
+    Migrate several legacy folders, different athletes in parallel.
+
+    Folders that map to the same athlete share athlete.json and intro/, so
+    each athlete's folders run in order on one worker; distinct athletes
+    are independent and overlap their (I/O-bound) moves. Results are
+    returned in the same order as folders.
+    """
+    groups: dict = {}
+    for index, folder in enumerate(folders):
+        try:
+            key = parse_legacy_name(folder.name)[0].casefold()
+        except ValueError:
+            # migrate_athlete reports the bad name; give it its own group
+            key = ("invalid", index)
+        groups.setdefault(key, []).append(index)
+
+    results: List[Optional[dict]] = [None] * len(folders)
+
+    def run_group(indexes: List[int]) -> None:
+        for i in indexes:
+            results[i] = migrate_athlete(folders[i], dry_run=dry_run, force=force,
+                                         fast_copy=fast_copy)
+
+    workers = max(1, min(os.cpu_count() or 1, len(groups), MIGRATE_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() re-raises the first worker exception
+        list(pool.map(run_group, groups.values()))
+
+    return results
+
+
+# Console prefix for each action type; anything else is a planned/done step
+ACTION_PREFIXES = {
+    "ERROR": "  ❌ ",
+    "SKIP": "  ⏭️ ",
+    "NOTE": "  ℹ️ ",
+    "WARNING": "  ⚠️ ",
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Migrate legacy athlete folders to v2 multi-project structure",
@@ -301,6 +470,8 @@ Examples:
                        help="Show what would change without modifying anything")
     parser.add_argument("--force", action="store_true",
                        help="Overwrite existing target folders")
+    parser.add_argument("--fast-copy", action="store_true",
+                       help="Copy large folders in parallel when moving across drives")
 
     args = parser.parse_args()
 
@@ -338,25 +509,23 @@ Examples:
     if args.dry_run:
         print("DRY RUN - No changes will be made\n")
 
+    results = migrate_all(folders, dry_run=args.dry_run, force=args.force,
+                          fast_copy=args.fast_copy)
+
     success_count = 0
-    for folder in folders:
+    for folder, result in zip(folders, results):
         print(f"\n{'='*60}")
         print(f"Migrating: {folder.name}")
         print(f"{'='*60}")
 
-        result = migrate_athlete(folder, dry_run=args.dry_run, force=args.force)
-
-        for action in result["actions"]:
-            prefix = "  "
-            if action.startswith("ERROR"):
-                prefix = "  ❌ "
-            elif action.startswith("SKIP"):
-                prefix = "  ⏭️ "
-            elif action.startswith("NOTE"):
-                prefix = "  ℹ️ "
-            else:
-                prefix = "  ✓ " if not args.dry_run else "  → "
-            print(f"{prefix}{action}")
+        default_prefix = "  ✓ " if not args.dry_run else "  → "
+        lines = [
+            next((p for k, p in ACTION_PREFIXES.items() if action.startswith(k)), default_prefix)
+            + action
+            for action in result["actions"]
+        ]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
         if result["success"]:
             if result["athlete_name"]:
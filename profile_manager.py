@@ -11,16 +11,30 @@ This module is extracted from soccerhype_gui.py to improve code organization and
 maintainability while maintaining security best practices.
 """
 
+import hashlib
 import json
 import os
 import pathlib
 import re
+import string
 import tempfile
 import time
 import tkinter as tk
 from tkinter import messagebox
 from typing import Dict, List, Optional
 
+from utils import jsonio
+
+# ASCII characters sanitize_profile_id drops: everything but letters, digits
+# and whitespace (non-ASCII is handled separately)
+_ID_DELETE_TABLE = str.maketrans('', '', ''.join(
+    chr(cp) for cp in range(128)
+    if not (chr(cp) in string.ascii_letters or chr(cp) in string.digits or chr(cp).isspace())
+))
+
+# Patterns used on every validate call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 def sanitize_profile_id(name: str) -> str:
     """
@@ -33,9 +47,12 @@ def sanitize_profile_id(name: str) -> str:
         A sanitized profile ID containing only alphanumeric characters and underscores
     """
     # Remove all non-alphanumeric characters except spaces, convert to lowercase
-    clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', name).strip().lower()
-    # Replace spaces with underscores and collapse multiple underscores
-    clean_name = re.sub(r'\s+', '_', clean_name)
+    clean_name = name.translate(_ID_DELETE_TABLE)
+    if not clean_name.isascii():
+        # Accented/other letters are dropped too; Unicode spaces are kept
+        clean_name = ''.join(c for c in clean_name if c.isascii() or c.isspace())
+    # Replace runs of whitespace with single underscores
+    clean_name = '_'.join(clean_name.lower().split())
     # Remove leading/trailing underscores and limit length
     clean_name = clean_name.strip('_')[:20]
     # Ensure it's not empty
@@ -64,22 +81,46 @@ class PlayerProfileManager:
         """
         self.profiles_db_path = profiles_db_path
         self.player_profiles: Dict[str, Dict] = {}
+        # Lower-cased player name per profile ID, for search_profiles
+        self._name_lower_by_id: Dict[str, str] = {}
+        # Digest of the bytes last read from or written to profiles_db_path
+        self._saved_digest: Optional[bytes] = None
         self.load_player_profiles()
 
     def load_player_profiles(self) -> None:
         """Load player profiles from database file with error handling."""
         try:
             if self.profiles_db_path.exists():
-                with open(self.profiles_db_path, 'r', encoding='utf-8') as f:
-                    self.player_profiles = json.load(f)
+                raw = self.profiles_db_path.read_bytes()
+                self.player_profiles = jsonio.loads(raw)
+                self._saved_digest = hashlib.blake2b(raw).digest()
             else:
                 self.player_profiles = {}
+                self._saved_digest = None
         except (IOError, json.JSONDecodeError) as e:
             messagebox.showerror("Error", f"Could not load player profiles: {e}")
             self.player_profiles = {}
+            self._saved_digest = None
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Recompute the lower-cased name index from player_profiles."""
+        self._name_lower_by_id = {
+            profile_id: profile_data.get('name', '').lower()
+            for profile_id, profile_data in self.player_profiles.items()
+        }
 
     def save_player_profiles(self) -> None:
         """Save player profiles using atomic write operation."""
+        # Callers may have edited player_profiles directly before saving
+        self._rebuild_index()
+
+        data = jsonio.dumps(self.player_profiles)
+        digest = hashlib.blake2b(data).digest()
+        if digest == self._saved_digest and self.profiles_db_path.exists():
+            # Nothing changed since the last load/save; skip the rewrite
+            return
+
         try:
             # Use atomic write: write to temp file, then rename
             temp_fd, temp_path = tempfile.mkstemp(
@@ -87,10 +128,15 @@ class PlayerProfileManager:
                 dir=self.profiles_db_path.parent
             )
             try:
-                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                    json.dump(self.player_profiles, f, indent=2, ensure_ascii=False)
+                with os.fdopen(temp_fd, 'wb') as f:
+                    f.write(data)
+                    # Data must be on disk before the rename is, or a crash
+                    # can leave an empty profiles file behind
+                    f.flush()
+                    os.fsync(f.fileno())
                 # Atomic rename on same filesystem
                 os.replace(temp_path, self.profiles_db_path)
+                self._saved_digest = digest
             except Exception:
                 # Clean up temp file on error
                 try:
@@ -100,6 +146,24 @@ class PlayerProfileManager:
                 raise
         except IOError as e:
             messagebox.showerror("Error", f"Could not save player profiles: {e}")
+            return
+
+        # The new file is already in place; a failed directory sync only
+        # weakens crash durability, so it is not a save error
+        try:
+            self._fsync_parent_dir()
+        except OSError as e:
+            print(f"Warning: Could not sync profiles directory: {e}")
+
+    def _fsync_parent_dir(self) -> None:
+        """Persist the rename itself by syncing the containing directory (POSIX only)."""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        dir_fd = os.open(self.profiles_db_path.parent, os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
     def get_profile_names(self) -> List[str]:
         """Get list of profile IDs for dropdown menus."""
@@ -132,6 +196,7 @@ class PlayerProfileManager:
         profile_data["modified"] = current_time
 
         self.player_profiles[profile_id] = profile_data
+        self._name_lower_by_id[profile_id] = profile_data.get('name', '').lower()
         self.save_player_profiles()
 
     def delete_profile(self, profile_id: str) -> bool:
@@ -146,6 +211,7 @@ class PlayerProfileManager:
         """
         if profile_id in self.player_profiles:
             del self.player_profiles[profile_id]
+            self._name_lower_by_id.pop(profile_id, None)
             self.save_player_profiles()
             return True
         return False
@@ -172,8 +238,7 @@ class PlayerProfileManager:
         # Validate email if provided
         email = profile_data.get('email', '').strip()
         if email:
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, email):
+            if not _EMAIL_RE.match(email):
                 errors.append("Invalid email format")
 
         # Validate GPA if provided
@@ -252,11 +317,7 @@ class PlayerProfileManager:
             List of profile IDs matching the search term
         """
         search_lower = search_term.lower()
-        matching_ids = []
-
-        for profile_id, profile_data in self.player_profiles.items():
-            name = profile_data.get('name', '').lower()
-            if search_lower in name:
-                matching_ids.append(profile_id)
-
-        return matching_ids
\ No newline at end of file
+        return [
+            profile_id for profile_id, name in self._name_lower_by_id.items()
+            if search_lower in name
+        ]
\ No newline at end of file
@@ -30,6 +30,7 @@ import platform
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageDraw, ImageFont
 
 # Import FFmpeg utilities for bundled binary detection
@@ -80,6 +81,10 @@ CRF = 18
 PROXY_W = 1920
 VIDEO_ONLY = True
 
+# Set in clip-render worker processes so parallel ffmpeg encodes split the
+# cores between them instead of each spawning one thread per core
+_ffmpeg_threads: int | None = None
+
 # -------------------- security and cross-platform utils --------------------
 
 def escape_drawtext(text: str) -> str:
@@ -175,7 +180,14 @@ def find_dejavu_font() -> str:
 
 # -------------------- utils --------------------
 
+def _limit_threads(cmd_list):
+    """Add an output -threads cap to an ffmpeg command inside a render worker."""
+    if _ffmpeg_threads and cmd_list and cmd_list[0] == FFMPEG_CMD:
+        return [*cmd_list[:-1], "-threads", str(_ffmpeg_threads), cmd_list[-1]]
+    return cmd_list
+
 def run(cmd_list):
+    cmd_list = _limit_threads(cmd_list)
     print("•", " ".join(map(str, cmd_list)))
     if subprocess.call(cmd_list) != 0:
         raise RuntimeError("Command failed")
@@ -270,14 +282,11 @@ def duration_of(path: pathlib.Path) -> float:
     except:
         return 0.0
 
-def proxy_fps(path: pathlib.Path) -> float:
-    p = subprocess.run(
-        [FFPROBE_CMD,"-v","error","-select_streams","v:0",
-         "-show_entries","stream=avg_frame_rate",
-         "-of","default=nk=1:nw=1", str(path)],
-        capture_output=True, text=True
-    )
-    s = p.stdout.strip()
+# (path, mtime_ns) -> (fps, frame_count, duration); proxies don't change
+# during a render, so each clip is probed once
+_probe_cache: dict[tuple[str, int], tuple[float, int, float]] = {}
+
+def _parse_rate(s: str) -> float:
     if "/" in s:
         a, b = s.split("/")
         try:
@@ -288,19 +297,44 @@ def proxy_fps(path: pathlib.Path) -> float:
     except:
         return 30.0
 
-def proxy_frame_count(path: pathlib.Path) -> int:
+def probe_video(path: pathlib.Path) -> tuple[float, int, float]:
+    """Return (fps, frame_count, duration) from a single ffprobe run."""
+    try:
+        key = (str(path), path.stat().st_mtime_ns)
+    except OSError:
+        key = None
+    if key is not None and key in _probe_cache:
+        return _probe_cache[key]
+
     p = subprocess.run(
         [FFPROBE_CMD,"-v","error","-select_streams","v:0","-count_frames",
-         "-show_entries","stream=nb_read_frames",
-         "-of","default=nk=1:nw=1", str(path)],
+         "-show_entries","stream=avg_frame_rate,nb_read_frames:format=duration",
+         "-of","json", str(path)],
         capture_output=True, text=True
     )
-    txt = p.stdout.strip()
-    if txt.isdigit():
-        return int(txt)
-    fps = proxy_fps(path)
-    dur = duration_of(path)
-    return max(1, int(round(fps * dur)))
+    try:
+        info = json.loads(p.stdout)
+    except ValueError:
+        info = {}
+    streams = info.get("streams") or [{}]
+    fps = _parse_rate(str(streams[0].get("avg_frame_rate", "")).strip())
+    try:
+        dur = float(info.get("format", {}).get("duration", ""))
+    except ValueError:
+        dur = 0.0
+    txt = str(streams[0].get("nb_read_frames", "")).strip()
+    total = int(txt) if txt.isdigit() else max(1, int(round(fps * dur)))
+
+    result = (fps, total, dur)
+    if key is not None:
+        _probe_cache[key] = result
+    return result
+
+def proxy_fps(path: pathlib.Path) -> float:
+    return probe_video(path)[0]
+
+def proxy_frame_count(path: pathlib.Path) -> int:
+    return probe_video(path)[1]
 
 def to_frame(t: float, fps: float) -> int:
     return max(0, int(round(t * fps)))
@@ -329,6 +363,7 @@ def ensure_proxy(src_path: pathlib.Path, std_path: pathlib.Path):
         "-pix_fmt","yuv420p",
         str(std_path)
     ]
+    cmd = _limit_threads(cmd)
     print("•", " ".join(cmd))
     proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     if proc.returncode != 0:
@@ -708,8 +743,7 @@ def make_freeze_with_spot(std_mp4: pathlib.Path, px: int, py: int, radius: int,
         zoom: Zoom factor (1.0 = no zoom, up to 2.0)
         still_dur: Duration of freeze frame in seconds
     """
-    fps = proxy_fps(std_mp4)
-    total_f = proxy_frame_count(std_mp4)
+    fps, total_f, _dur = probe_video(std_mp4)
     start_f = to_frame(start_trim, fps)
     end_f_cut = total_f - 1 - to_frame(end_trim, fps)
     spot_f = max(start_f, min(int(spot_frame), end_f_cut))
@@ -758,6 +792,38 @@ def make_freeze_with_spot(std_mp4: pathlib.Path, px: int, py: int, radius: int,
 
     concat_videos(parts, out_mp4)
 
+# -------------------- parallel clip rendering --------------------
+
+def _init_render_worker(ffmpeg_threads: int):
+    global _ffmpeg_threads
+    _ffmpeg_threads = ffmpeg_threads
+
+def _render_one_clip(job: dict) -> pathlib.Path:
+    """Build one clip's proxy and freeze/ring segment (runs in a worker process)."""
+    std_path = job["std_path"]
+    ensure_proxy(job["src_path"], std_path)
+
+    spot_frame_std = job["spot_frame_std"]
+    if spot_frame_std < 0:
+        fps = proxy_fps(std_path)
+        spot_frame_std = to_frame(job["spot_time"], fps)
+
+    make_freeze_with_spot(std_path, job["mx"], job["my"], job["radius"], job["out"],
+                          job["start_trim"], job["end_trim"],
+                          spot_frame_std, job["work"],
+                          zoom=job["zoom"],
+                          still_dur=1.25)
+    return job["out"]
+
+def render_clips(jobs: list[dict], max_workers: int) -> list[pathlib.Path]:
+    """Render clips, several at once when max_workers > 1. Results keep job order."""
+    if max_workers <= 1 or len(jobs) <= 1:
+        return [_render_one_clip(job) for job in jobs]
+    ffmpeg_threads = max(1, (os.cpu_count() or 2) // max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_render_worker,
+                             initargs=(ffmpeg_threads,)) as ex:
+        return list(ex.map(_render_one_clip, jobs))
+
 # -------------------- main --------------------
 
 def main():
@@ -769,6 +835,8 @@ def main():
     ap.add_argument("--reset-intro", action="store_true", help="Reset intro media selection and choose again")
     ap.add_argument("--slate-template", type=str, default=None,
                     help="Slate template name (classic, modern, bold, cinematic, clean)")
+    ap.add_argument("--jobs", type=int, default=0,
+                    help="Clips to render in parallel (default: half the CPU cores; 1 = one at a time)")
     args = ap.parse_args()
 
     athlete_dir = None
@@ -890,41 +958,45 @@ def main():
             else:
                 print("Using text-only slate")
 
-    processed = []
-    seen_sections = set()  # Track sections we've already shown overlay for
-
-    for i, c in enumerate(data.get("clips", []), 1):
+    clips = data.get("clips", [])
+    jobs = []
+    for i, c in enumerate(clips, 1):
         # Resolve std_file if present, otherwise use default path
         std_path = resolve_path(base, c.get("std_file"))
         if std_path is None:
             std_path = base / "work" / "proxies" / f"clip{i:02d}_std.mp4"
 
-        # Ensure proxy exists (build it if missing) using original file path
+        # Proxy is built from the original file path if missing
         src_path = resolve_path(base, c.get("file"))
         if src_path is None:
             raise RuntimeError(f"Clip {i}: source 'file' missing in project.json")
-        ensure_proxy(src_path, std_path)
 
         # Marker/spot values (prefer *_std if present)
-        mx = int(c.get("marker_x_std", c.get("marker_x", 960)))
-        my = int(c.get("marker_y_std", c.get("marker_y", 540)))
-        radius_std = int(c.get("radius_std", c.get("radius", 72)))
-        spot_frame_std = int(c.get("spot_frame_std", -1))
-        if spot_frame_std < 0:
-            fps = proxy_fps(std_path)
-            spot_frame_std = to_frame(float(c.get("spot_time", 0.0)), fps)
-
-        # Read zoom factor (default 1.0 for backward compatibility)
-        zoom_std = float(c.get("zoom_std", 1.0))
-
-        out = work / f"clip{i:02d}_done.mp4"
-        make_freeze_with_spot(std_path, mx, my, radius_std, out,
-                              float(c.get("start_trim", 0.0)),
-                              float(c.get("end_trim", 0.0)),
-                              spot_frame_std, work,
-                              zoom=zoom_std,
-                              still_dur=1.25)
+        jobs.append({
+            "std_path": std_path,
+            "src_path": src_path,
+            "mx": int(c.get("marker_x_std", c.get("marker_x", 960))),
+            "my": int(c.get("marker_y_std", c.get("marker_y", 540))),
+            "radius": int(c.get("radius_std", c.get("radius", 72))),
+            "spot_frame_std": int(c.get("spot_frame_std", -1)),
+            "spot_time": float(c.get("spot_time", 0.0)),
+            # Read zoom factor (default 1.0 for backward compatibility)
+            "zoom": float(c.get("zoom_std", 1.0)),
+            "out": work / f"clip{i:02d}_done.mp4",
+            "start_trim": float(c.get("start_trim", 0.0)),
+            "end_trim": float(c.get("end_trim", 0.0)),
+            "work": work,
+        })
+
+    # Clips are independent (own proxy, own work/clipNN_* files) and each
+    # x264 encode is CPU-bound, so render them side by side
+    jobs_n = args.jobs if args.jobs > 0 else max(1, (os.cpu_count() or 2) // 2)
+    rendered = render_clips(jobs, min(jobs_n, len(jobs)))
+
+    processed = []
+    seen_sections = set()  # Track sections we've already shown overlay for
 
+    for i, (c, out) in enumerate(zip(clips, rendered), 1):
         # Apply section lower-third overlay if this is the first clip of a new section
         clip_section = c.get("section")
         if clip_section and clip_section not in seen_sections:
@@ -18,6 +18,7 @@ from .structure import (
     get_intro_dir,
     SCHEMA_VERSION,
 )
+from .jsonio import atomic_write_json
 
 __all__ = [
     "detect_structure",
@@ -32,4 +33,5 @@ __all__ = [
     "list_projects",
     "get_intro_dir",
     "SCHEMA_VERSION",
+    "atomic_write_json",
 ]
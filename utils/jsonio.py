@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 John Hull
+# Licensed under the MIT License - see LICENSE file
+"""
+JSON read/write helpers.
+
+Uses orjson when it is installed (considerably faster for large project files)
+and falls back to the standard library otherwise. Writes go through a temp file
+in the same directory followed by os.replace, so an interrupted save never
+leaves a truncated file behind.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import tempfile
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, 2-space indented or compact."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes. Raises json.JSONDecodeError on invalid input."""
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _replacement_mode(path: pathlib.Path) -> int:
+    """Permissions the replacement file should get: the existing file's, or
+    0644 for a new file."""
+    try:
+        return path.stat().st_mode & 0o7777
+    except OSError:
+        return 0o644
+
+
+def atomic_write_json(path: pathlib.Path, data: Any, indent: bool = True) -> None:
+    """Write JSON to path atomically using temp file + os.replace."""
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=f".{path.stem}_",
+        suffix=".json.tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dumps(data, indent=indent))
+        # mkstemp creates the file 0600 and os.replace would keep that
+        os.chmod(temp_path, _replacement_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
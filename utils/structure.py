@@ -29,6 +29,7 @@ v2 (Multi-Project) Structure:
 
 from __future__ import annotations
 
+import functools
 import json
 import pathlib
 import shutil
@@ -78,6 +79,18 @@ def is_v2_structure(path: pathlib.Path) -> bool:
     return detect_structure(path) == "v2"
 
 
+@functools.lru_cache(maxsize=512)
+def is_v2_structure_cached(path_str: str) -> bool:
+    """
+    Memoized is_v2_structure() keyed on the folder path string.
+
+    For folder scans that classify the same folders several times. Call
+    is_v2_structure_cached.cache_clear() after anything that creates or
+    moves a folder's athlete.json / projects/ markers.
+    """
+    return is_v2_structure(pathlib.Path(path_str))
+
+
 def resolve_athlete_dir(path: pathlib.Path) -> Optional[pathlib.Path]:
     """
     Find the athlete root directory from any path within the athlete structure.